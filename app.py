@@ -1,10 +1,68 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, send_file
 import subprocess
+import threading
+import selectors
+import time
 import os
-import json
+import orjson
 
 app = Flask(__name__)
 
+# Long-running Node worker that keeps one Puppeteer browser open between requests
+_worker = None
+_worker_lock = threading.Lock()
+# Seconds to wait for a reply; the worker's page loads time out well before this, so a
+# worker still silent at the deadline is hung and is killed instead of blocking every request
+_WORKER_TIMEOUT = 180
+
+def _read_reply(worker, timeout):
+    """Read one line from the worker's stdout, returning None if it does not arrive within timeout seconds."""
+    deadline = time.monotonic() + timeout
+    fd = worker.stdout.fileno()
+    chunks = []
+    with selectors.DefaultSelector() as selector:
+        selector.register(fd, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not selector.select(remaining):
+                return None
+            chunk = os.read(fd, 65536)
+            # An empty read is EOF: the worker exited
+            if not chunk or b'\n' in chunk:
+                chunks.append(chunk)
+                return b''.join(chunks).partition(b'\n')[0]
+            chunks.append(chunk)
+
+def _run_search_worker(url):
+    """Send url to the Node worker and return its parsed reply, restarting the worker if it died."""
+    global _worker
+    with _worker_lock:
+        if _worker is None or _worker.poll() is not None:
+            # Binary pipes: replies are read straight from the fd so the read can have a deadline
+            _worker = subprocess.Popen(
+                ['node', 'search_worker.js'],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+        _worker.stdin.write(orjson.dumps({'url': url}) + b'\n')
+        _worker.stdin.flush()
+        reply = _read_reply(_worker, _WORKER_TIMEOUT)
+        if reply is None:
+            # Hung worker: kill it so the next request starts a fresh one
+            _worker.kill()
+            _worker.wait()
+            _worker = None
+            raise RuntimeError('Puppeteer worker timed out')
+    if not reply:
+        raise RuntimeError('Puppeteer worker exited unexpectedly')
+    return orjson.loads(reply)
+
+_URL_TRANS = str.maketrans({'/': '_', ':': '_', '.': '_'})
+
+def sanitize_url(url):
+    """Sanitize the URL to match the Puppeteer script's directory structure"""
+    without_protocol = url.removeprefix('https://').removeprefix('http://')
+    return without_protocol.rstrip('/').translate(_URL_TRANS)
+
 @app.route('/')
 def hello_world():
     return 'Hello, World!'
@@ -15,31 +73,24 @@ def search():
     if not url:
         return jsonify({'error': 'URL parameter is required'}), 400
 
-    # Sanitize the URL to match the Puppeteer script's directory structure
-    def sanitize_url(url):
-        without_protocol = url.replace('http://', '').replace('https://', '')
-        without_trailing_slash = without_protocol.rstrip('/')
-        return without_trailing_slash.replace('/', '_').replace(':', '_').replace('.', '_')
-
     sanitized_url = sanitize_url(url)
     data_dir = os.path.join('data', sanitized_url)
     data_file = os.path.join(data_dir, 'extracted_data.json')
 
-    # Run the Puppeteer script
+    # Run the Puppeteer extraction in the persistent worker
     try:
-        subprocess.run(['node', 'search_puppeteer.js', url], check=True)
-    except subprocess.CalledProcessError as e:
+        reply = _run_search_worker(url)
+    except (OSError, RuntimeError, ValueError) as e:
         return jsonify({'error': f'Failed to run Puppeteer script: {str(e)}'}), 500
+    if not reply.get('ok'):
+        return jsonify({'error': f"Failed to run Puppeteer script: {reply.get('error')}"}), 500
 
     # Check if the extracted data file exists
     if not os.path.exists(data_file):
         return jsonify({'error': f'Extracted data file not found: {data_file}'}), 404
 
-    # Read and return the extracted data
-    with open(data_file, 'r') as f:
-        data = json.load(f)
-
-    return jsonify(data)
+    # Return the file as-is rather than parsing and re-serializing it
+    return send_file(os.path.abspath(data_file), mimetype='application/json')
 
 if __name__ == '__main__':
     app.run(debug=True, port=5001)
@@ -1,15 +1,36 @@
 import difflib
+import re
+import subprocess
+
+HUNK_HEADER = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
 
 def detailed_diff(file1, file2):
+    # Let the system diff find the changed regions, it is far faster than ndiff on large files
+    result = subprocess.run(['diff', '-u', file1, file2], capture_output=True, text=True)
+    if result.returncode > 1:
+        raise RuntimeError(f"diff failed: {result.stderr.strip()}")
+
     with open(file1, 'r') as f1, open(file2, 'r') as f2:
         file1_lines = f1.readlines()
         file2_lines = f2.readlines()
 
-    diff = difflib.ndiff(file1_lines, file2_lines)
-    for line in diff:
-        # Output all the lines, including unchanged lines with context
-        if line.startswith('- ') or line.startswith('+ ') or line.startswith('? '):
-            print(line.rstrip())
+    # Only run ndiff over the small windows diff reported, to keep the '? ' hint lines
+    for header in result.stdout.splitlines():
+        match = HUNK_HEADER.match(header)
+        if not match:
+            continue
+        start1, count1, start2, count2 = match.groups()
+        start1, start2 = int(start1), int(start2)
+        count1 = int(count1) if count1 is not None else 1
+        count2 = int(count2) if count2 is not None else 1
+        # A zero-length range is reported as the line before the change
+        start1 = start1 - 1 if count1 else start1
+        start2 = start2 - 1 if count2 else start2
+        diff = difflib.ndiff(file1_lines[start1:start1 + count1], file2_lines[start2:start2 + count2])
+        for line in diff:
+            # Output all the lines, including unchanged lines with context
+            if line.startswith('- ') or line.startswith('+ ') or line.startswith('? '):
+                print(line.rstrip())
 
 file1 = 'search80.py'
 file2 = 'search79.py'
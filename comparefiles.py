@@ -1,14 +1,15 @@
-import difflib
+import subprocess
+import sys
 
 def compare_files(file1_path, file2_path):
-    with open(file1_path, 'r') as file1, open(file2_path, 'r') as file2:
-        file1_lines = file1.readlines()
-        file2_lines = file2.readlines()
+    result = subprocess.run(
+        ['diff', '-u', '--label', 'search86.py', '--label', 'search86b.py', file1_path, file2_path],
+        capture_output=True, text=True
+    )
+    if result.returncode > 1:
+        raise RuntimeError(f"diff failed: {result.stderr.strip()}")
 
-    diff = difflib.unified_diff(file1_lines, file2_lines, fromfile='search86.py', tofile='search86b.py')
-
-    for line in diff:
-        print(line, end='')
+    sys.stdout.write(result.stdout)
 
 if __name__ == '__main__':
     file1_path = 'search86.py'  # Path to the first file
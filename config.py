@@ -1,4 +1,5 @@
 # filepath: /Users/josephJbrink/Desktop/scripts/config.py
+import re
 
 # Example configuration variables
 TOR_PROXY = {
@@ -6,12 +7,12 @@ TOR_PROXY = {
     "https": "socks5h://127.0.0.1:9050"
 }
 
-# Key data patterns for PDF extraction
+# Key data patterns for PDF extraction, compiled once at import
 key_data_patterns = {
-    "donation": r"\$\d+(?:,\d{3})*(?:\.\d{2})?",  # Matches monetary amounts like $1,000.00
-    "email": r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",  # Matches email addresses
+    "donation": re.compile(r"\$\d+(?:,\d{3})*(?:\.\d{2})?"),  # Matches monetary amounts like $1,000.00
+    "email": re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),  # Matches email addresses
     # Use robust phone regex (international and US)
-    "phone": r"(?:\\+?\\d{1,2}[\\s.-]?)?(?:\\(?\\d{3}\\)?[\\s.-]?)?\\d{3}[\\s.-]?\\d{4}",
-    "address": r"\d{1,5}\s\w+(\s\w+)*,\s\w+,\s[A-Z]{2}\s\d{5}",  # Matches addresses like 123 Main St, City, ST 12345
-    "name": r"\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)+\b",  # Matches names like "John Doe" or "John Michael Doe"
+    "phone": re.compile(r"(?:\+?\d{1,2}[\s.-]?)?(?:\(?\d{3}\)?[\s.-]?)?\d{3}[\s.-]?\d{4}"),
+    "address": re.compile(r"\d{1,5}\s\w+(?:\s\w+)*,\s\w+,\s[A-Z]{2}\s\d{5}"),  # Matches addresses like 123 Main St, City, ST 12345
+    "name": re.compile(r"\b[A-Z][a-z]+(?:\s[A-Z][a-z]+)+\b"),  # Matches names like "John Doe" or "John Michael Doe"
 }
\ No newline at end of file
@@ -1,50 +1,83 @@
 import os
 import ast
 import sys
+import json
+import multiprocessing
 
-class ModuleAnalyzer(ast.NodeVisitor):
-    def __init__(self):
-        self.imports = set()
-        self.issues = []
-
-    def visit_Import(self, node):
-        for alias in node.names:
-            self.imports.add(alias.name)
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node):
-        if node.module:
-            self.imports.add(node.module)
-        self.generic_visit(node)
-
-    def visit_FunctionDef(self, node):
-        self.generic_visit(node)
-
-    def visit_ClassDef(self, node):
-        self.generic_visit(node)
+# Sidecar in the analyzed directory: relative path -> [size, mtime_ns, imports, issues],
+# so a later run only re-parses files that changed since the last one
+CACHE_FILE = '.fixer_cache.json'
 
 def analyze_file(filepath):
     with open(filepath, 'r', encoding='utf-8') as file:
         tree = ast.parse(file.read(), filename=filepath)
-    analyzer = ModuleAnalyzer()
-    analyzer.visit(tree)
-    return analyzer.imports, analyzer.issues
+    imports = set()
+    issues = []
+    # Only import nodes matter, so walk the tree flat instead of dispatching visit_* per node
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module:
+                imports.add(node.module)
+    return imports, issues
 
 def find_python_files(directory):
-    python_files = []
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith('.py'):
-                python_files.append(os.path.join(root, file))
-    return python_files
+    # Walk with scandir directly; DirEntry already knows whether it is a directory
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
+def _analyze_with_key(key):
+    return key, analyze_file(key[0])
+
+def load_cache(directory):
+    try:
+        with open(os.path.join(directory, CACHE_FILE), 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(directory, cache):
+    try:
+        with open(os.path.join(directory, CACHE_FILE), 'w', encoding='utf-8') as file:
+            json.dump(cache, file)
+    except OSError as e:
+        # Only a cache; the next run re-parses whatever is missing
+        print(f"Could not write {CACHE_FILE}: {e}")
 
 def main(directory):
     python_files = find_python_files(directory)
     all_imports = set()
     all_issues = []
 
+    cache = load_cache(directory)
+    entries = {}
+    pending = []
     for filepath in python_files:
-        imports, issues = analyze_file(filepath)
+        stat = os.stat(filepath)
+        stamp = [stat.st_size, stat.st_mtime_ns]
+        name = os.path.relpath(filepath, directory)
+        entry = cache.get(name)
+        if entry and entry[:2] == stamp:
+            entries[name] = entry
+        else:
+            pending.append((filepath, name, stamp))
+    # Parsing is CPU-bound and independent per file, so spread it over all cores
+    if pending:
+        with multiprocessing.Pool() as pool:
+            for (filepath, name, stamp), (imports, issues) in pool.imap_unordered(_analyze_with_key, pending, chunksize=16):
+                entries[name] = stamp + [sorted(imports), issues]
+        # Rewritten from this run's entries, so deleted files drop out
+        save_cache(directory, entries)
+
+    for _, _, imports, issues in entries.values():
         all_imports.update(imports)
         all_issues.extend(issues)
 
@@ -1,18 +1,82 @@
 import os
-import json
-import time
+import orjson
+import queue
+import atexit
+import threading
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from requests_html import HTMLSession
 
 class WebAuthenticator:
+    # Chrome sessions are expensive to launch, so idle ones are kept per headless mode and reused
+    _driver_pools = {True: queue.SimpleQueue(), False: queue.SimpleQueue()}
+    _all_drivers = []
+    _drivers_lock = threading.Lock()
+
     def __init__(self):
         self.session = None
         self.driver = None
+        self._driver_headless = None
         self.cookies_file = "session_cookies.json"
+
+    @classmethod
+    def _acquire_driver(cls, headless):
+        """Take an idle Chrome session from the pool, launching one if none is free"""
+        pool = cls._driver_pools[headless]
+        while True:
+            try:
+                driver = pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                # Wipe everything the previous login left behind, for every origin:
+                # delete_all_cookies only covers the current page's domain and no storage
+                driver.get("about:blank")
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "*", "storageTypes": "all"})
+                return driver
+            except Exception:
+                # The session died while idle (or cannot be cleared); drop it and try the next one
+                cls._discard_driver(driver)
+
+        # Setup Chrome options
+        chrome_options = Options()
+        if headless:
+            chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+
+        driver = webdriver.Chrome(options=chrome_options)
+        with cls._drivers_lock:
+            cls._all_drivers.append(driver)
+        return driver
+
+    @classmethod
+    def _discard_driver(cls, driver):
+        """Quit a Chrome session that must not be reused"""
+        with cls._drivers_lock:
+            if driver in cls._all_drivers:
+                cls._all_drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @classmethod
+    def _drain_pool(cls):
+        """Quit every Chrome session started by this class"""
+        with cls._drivers_lock:
+            drivers, cls._all_drivers = cls._all_drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
     
     def authenticate_with_requests(self, login_url, username, password, 
                                  username_field="username", password_field="password"):
@@ -52,15 +116,10 @@ class WebAuthenticator:
                                  headless=True):
         """Complex authentication using Selenium"""
         try:
-            # Setup Chrome options
-            chrome_options = Options()
-            if headless:
-                chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument("--disable-gpu")
-            
-            self.driver = webdriver.Chrome(options=chrome_options)
+            # Hand back any session from a previous login before taking a new one
+            self.cleanup()
+            self.driver = self._acquire_driver(headless)
+            self._driver_headless = headless
             self.driver.get(login_url)
             
             # Wait for and fill username
@@ -79,8 +138,11 @@ class WebAuthenticator:
             submit_button = self.driver.find_element(By.CSS_SELECTOR, submit_selector)
             submit_button.click()
             
-            # Wait for redirect or success
-            time.sleep(3)  # Give time for login to process
+            # Wait for the redirect instead of a fixed delay; a timeout falls through to the URL check
+            try:
+                WebDriverWait(self.driver, 10).until(EC.url_changes(login_url))
+            except TimeoutException:
+                pass
             
             # Check if login was successful (you may need to customize this)
             current_url = self.driver.current_url
@@ -100,24 +162,24 @@ class WebAuthenticator:
         """Save session cookies to file"""
         if self.session:
             cookies = self.session.cookies.get_dict()
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            with open(self.cookies_file, 'wb') as f:
+                f.write(orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
             print(f"✓ Cookies saved to {self.cookies_file}")
     
     def save_selenium_cookies(self):
         """Save Selenium cookies to file"""
         if self.driver:
             cookies = self.driver.get_cookies()
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            with open(self.cookies_file, 'wb') as f:
+                f.write(orjson.dumps(cookies, option=orjson.OPT_INDENT_2))
             print(f"✓ Selenium cookies saved to {self.cookies_file}")
     
     def load_cookies_to_session(self, session):
         """Load saved cookies into a requests session"""
         try:
             if os.path.exists(self.cookies_file):
-                with open(self.cookies_file, 'r') as f:
-                    cookies = json.load(f)
+                with open(self.cookies_file, 'rb') as f:
+                    cookies = orjson.loads(f.read())
                 # Handle both formats (requests dict and selenium list)
                 if isinstance(cookies, dict):
                     session.cookies.update(cookies)
@@ -137,5 +199,10 @@ class WebAuthenticator:
     def cleanup(self):
         """Clean up resources"""
         if self.driver:
-            self.driver.quit()
-            self.driver = None
\ No newline at end of file
+            # Return the browser to the pool; it is quit at interpreter exit
+            self._driver_pools[self._driver_headless].put(self.driver)
+            self.driver = None
+            self._driver_headless = None
+
+
+atexit.register(WebAuthenticator._drain_pool)
\ No newline at end of file
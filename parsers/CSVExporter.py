@@ -2,8 +2,103 @@ import os
 import csv
 import logging
 import re  # Added for validation and cleaning
+import functools
+import itertools
+import orjson
 from urllib.parse import urlparse
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    # google-re2 matches in linear time, which keeps scans of long scraped text bounded
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Patterns for obfuscated emails, each capturing (user, domain, tld)
+_OBFUSCATED_EMAIL_PATTERNS = (
+    r'([\w\.-]+)\s*\[at\]\s*([\w\.-]+)\s*\[dot\]\s*([\w\.]+)',
+    r'([\w\.-]+)\s*\(at\)\s*([\w\.-]+)\s*\(dot\)\s*([\w\.]+)',
+    r'([\w\.-]+)\s+at\s+([\w\.-]+)\s+dot\s+([\w\.]+)',
+    r'([\w\.-]+)\s*\[@\]\s*([\w\.-]+)\s*\[\.\]\s*([\w\.]+)',
+    r'([\w\.-]+)\s*\{at\}\s*([\w\.-]+)\s*\{dot\}\s*([\w\.]+)',
+    r'([\w\.-]+)\s*\(at\)\s*([\w\.-]+)\s*\.\s*([\w\.]+)',
+    r'([\w\.-]+)\s*\[at\]\s*([\w\.-]+)\s*\.\s*([\w\.]+)',
+    r'([\w\.-]+)\s*at\s*([\w\.-]+)\s*\.\s*([\w\.]+)',
+)
+# Fused into one alternation so the text is scanned once instead of once per pattern
+_OBFUSCATED_EMAIL_RE = _regex.compile(
+    '(?i)' + '|'.join(f'(?:{pattern})' for pattern in _OBFUSCATED_EMAIL_PATTERNS)
+)
+# Standard email, unanchored for extraction and anchored for validation
+_STANDARD_EMAIL_RE = _regex.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_EMAIL_RE = _regex.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Fenced by non-digits so a long digit run is rejected instead of being cut into a number
+_PHONE_RE = _regex.compile(r'(?:^|\D)(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})(?:\D|$)')
+
+class _CleanTable(dict):
+    """
+    str.translate table that drops every character r'[^\w\s]' would match.
+    Entries are filled in on first use, so only characters actually seen are stored.
+    """
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char == '_' or char.isspace() else None
+        self[codepoint] = value
+        return value
+
+_CLEAN_TABLE = _CleanTable()
+
+# Column order of the exported CSV; rows are written as tuples in this order
+FIELDNAMES = (
+    'Name', 'First Name', 'Last Name', 'Source URL', 'Type', 'Date',
+    'Email', 'Phone', 'Address',
+    'Donation Amount', 'Donation Context'
+)
+
+@functools.lru_cache(maxsize=256)
+def _domain_for(url):
+    # save_csv is called once per page, mostly for the same few sites
+    if url:
+        parsed_url = urlparse(url)
+        domain = parsed_url.netloc.replace('.', '_') if parsed_url.netloc else 'unknown_domain'
+    else:
+        domain = 'unknown_domain'
+    return domain, os.path.join('DATA', domain)
+
+def _as_list(value):
+    # Profiles may hold a single value instead of a list
+    return value if isinstance(value, list) else ([value] if value else [])
+
+def _email_columns(email, context):
+    return (email, '', '', '', context)
+
+def _phone_columns(phone, context):
+    normalized_phone = CSVExporter.normalize_phone_number(phone)
+    return ('', normalized_phone, '', '', context) if normalized_phone else None
+
+def _address_columns(address, context):
+    cleaned_address = CSVExporter.clean_field(address)
+    return ('', '', cleaned_address, '', context) if cleaned_address else None
+
+def _donation_columns(donation, context):
+    # Donations carry their own context rather than the profile's
+    if 'amount' in donation:
+        donation_context = donation.get('context', '')
+        if isinstance(donation_context, (dict, list)):
+            # Structured context is written as JSON rather than a Python repr
+            donation_context = orjson.dumps(donation_context).decode()
+        return ('', '', '', donation['amount'], donation_context)
+    return None
+
+# Sub-list key -> row Type, accepted item type and the builder of its trailing columns.
+# Items of other types are filtered out before the builder runs; a builder returning None skips the item.
+_PROFILE_RECORDS = (
+    ('Emails', 'email', str, _email_columns),
+    ('PhoneNumbers', 'phone', str, _phone_columns),
+    ('Addresses', 'address', str, _address_columns),
+    ('Donations', 'donation', dict, _donation_columns),
+)
 
 class CSVExporter:
     """
@@ -14,25 +109,17 @@ class CSVExporter:
     def extract_and_normalize_emails(text):
         """
         Extract and normalize both standard and obfuscated email formats from a string.
+        Every returned email passes is_valid_email.
         """
-        # Patterns for obfuscated emails
-        patterns = [
-            r'([\w\.-]+)\s*\[at\]\s*([\w\.-]+)\s*\[dot\]\s*([\w\.]+)',
-            r'([\w\.-]+)\s*\(at\)\s*([\w\.-]+)\s*\(dot\)\s*([\w\.]+)',
-            r'([\w\.-]+)\s+at\s+([\w\.-]+)\s+dot\s+([\w\.]+)',
-            r'([\w\.-]+)\s*\[@\]\s*([\w\.-]+)\s*\[\.\]\s*([\w\.]+)',
-            r'([\w\.-]+)\s*\{at\}\s*([\w\.-]+)\s*\{dot\}\s*([\w\.]+)',
-            r'([\w\.-]+)\s*\(at\)\s*([\w\.-]+)\s*\.\s*([\w\.]+)',
-            r'([\w\.-]+)\s*\[at\]\s*([\w\.-]+)\s*\.\s*([\w\.]+)',
-            r'([\w\.-]+)\s*at\s*([\w\.-]+)\s*\.\s*([\w\.]+)',
-        ]
-        # Standard email
-        standard_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        emails = set(re.findall(standard_pattern, text))
-        for pat in patterns:
-            for match in re.findall(pat, text, re.IGNORECASE):
-                email = f"{match[0]}@{match[1]}.{match[2]}"
-                emails.add(email.replace(' ', ''))
+        # Ordered dedupe so the exported rows come out in a stable order.
+        # Standard matches are valid by construction; only rebuilt ones need checking.
+        emails = dict.fromkeys(_STANDARD_EMAIL_RE.findall(text))
+        for match in _OBFUSCATED_EMAIL_RE.finditer(text):
+            # Only the three groups of the alternative that matched are set
+            user, domain, tld = [group for group in match.groups() if group is not None]
+            email = f"{user}@{domain}.{tld}".replace(' ', '')
+            if _EMAIL_RE.match(email):
+                emails[email] = None
         return list(emails)
 
     @staticmethod
@@ -41,223 +128,147 @@ class CSVExporter:
         Validate an email address using a regex pattern.
         """
         # Accept both standard and normalized obfuscated emails
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(email_pattern, email) is not None
+        return _EMAIL_RE.match(email) is not None
 
     @staticmethod
     def normalize_phone_number(phone):
         """
         Normalize phone numbers to a standard format (e.g., (123) 456-7890).
         """
-        phone_pattern = r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        match = re.search(phone_pattern, phone)
-        return match.group(0) if match else None
+        match = _PHONE_RE.search(phone)
+        return match.group(1) if match else None
 
     @staticmethod
     def clean_field(field):
         """
         Remove unwanted characters from a field.
         """
-        return re.sub(r'[^\w\s]', '', field).strip()
+        return field.translate(_CLEAN_TABLE).strip()
+
+    @staticmethod
+    def _profile_emails(profile, emails):
+        """
+        Return the valid emails among the profile's email strings plus any obfuscated ones found in its text fields.
+        """
+        emails = [email for email in emails if CSVExporter.is_valid_email(email)]
+        # Also scan for obfuscated emails in any text fields, in a single pass.
+        # NUL matches neither \s nor \w, so no match can span two fields.
+        text_fields = '\0'.join(
+            profile[field] for field in ('name', 'source', 'context')
+            if isinstance(profile.get(field), str)
+        )
+        emails = emails + CSVExporter.extract_and_normalize_emails(text_fields)
+        return list(dict.fromkeys(emails))
+
+    @staticmethod
+    def _flatten_profile(profile, standalone=False):
+        """
+        Yield (record type, trailing columns) for each email, phone, address and donation of a profile.
+
+        The trailing columns are Email, Phone, Address, Donation Amount and Donation Context.
+        For the standalone pseudo-profile, emails are extracted from each string instead of validated.
+        """
+        context = profile.get('context', '')
+        for key, record_type, item_type, to_columns in _PROFILE_RECORDS:
+            items = [item for item in _as_list(profile.get(key)) if isinstance(item, item_type)]
+            if key == 'Emails':
+                if standalone:
+                    # Also scan for obfuscated emails in each email string
+                    items = [em for email in items for em in CSVExporter.extract_and_normalize_emails(email)]
+                else:
+                    items = CSVExporter._profile_emails(profile, items)
+            for item in items:
+                columns = to_columns(item, context)
+                if columns is not None:
+                    yield record_type, columns
 
     @staticmethod
-    def save_csv(data_dict, url):
+    def _iter_rows(data_dict, url, now_str):
+        """
+        Yield the CSV rows for data_dict as tuples in FIELDNAMES order.
+        """
+        profiles = (
+            (profile, False) for profile in data_dict.get('Profiles', [])
+            if isinstance(profile, dict)
+        )
+        # Standalone items go through the same path as a pseudo-profile that only carries the page URL
+        standalone = {key: data_dict.get(key) for key, _, _, _ in _PROFILE_RECORDS}
+        standalone['source'] = url
+
+        for profile, is_standalone in itertools.chain(profiles, [(standalone, True)]):
+            # Leading columns shared by every row of this profile
+            person = (
+                profile.get('name', ''),
+                profile.get('first_name', ''),
+                profile.get('last_name', ''),
+                profile.get('source', '')
+            )
+            for record_type, columns in CSVExporter._flatten_profile(profile, is_standalone):
+                yield person + (record_type, now_str) + columns
+
+    @staticmethod
+    def save_many(jobs, max_workers=8):
+        """
+        Export several scraped pages concurrently, one save_csv call per job.
+
+        Args:
+            jobs (list): (data_dict, url) pairs, usually one per domain.
+            max_workers (int): Upper bound on the number of exports running at once.
+
+        Returns:
+            list: The filename returned by save_csv for each job, in job order.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return []
+        # Jobs for the same domain started in the same second would get the same timestamped
+        # name, so each file also carries its job index and no two threads write one path
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            return list(executor.map(
+                lambda indexed: CSVExporter.save_csv(*indexed[1], suffix=f"_{indexed[0]}"),
+                enumerate(jobs)
+            ))
+
+    @staticmethod
+    def save_csv(data_dict, url, suffix=''):
         """
         Saves the extracted data to a CSV file named after the URL of the site being scraped.
 
         Args:
-            data_dict (dict): The dictionary containing the extracted data.
+            data_dict (dict | bytes | str): The dictionary containing the extracted data,
+                or its JSON encoding as produced by the scraping stage.
             url (str): The URL of the site being scraped.
+            suffix (str): Appended to the timestamp in the filename, to tell apart exports made in the same second.
         """
         try:
-            # Create a sanitized filename from the URL
-            if url:
-                parsed_url = urlparse(url)
-                domain = parsed_url.netloc.replace('.', '_') if parsed_url.netloc else 'unknown_domain'
-            else:
-                domain = 'unknown_domain'
-            directory = os.path.join('DATA', domain)
-            os.makedirs(directory, exist_ok=True)
-            filename = os.path.join(directory, f"{domain}_donor_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
-            
-            # Prepare the data for CSV export
-            rows = []
-            
-            # Add profiles and their associated data
-            for profile in data_dict.get('Profiles', []):
-                if not isinstance(profile, dict):
-                    continue
-                
-                # Create base row with profile info
-                base_row = {
-                    'Name': profile.get('name', ''),
-                    'First Name': profile.get('first_name', ''),
-                    'Last Name': profile.get('last_name', ''),
-                    'Source URL': profile.get('source', ''),
-                    'Type': 'profile',
-                    'Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'Email': '',
-                    'Phone': '',
-                    'Address': '',
-                    'Donation Amount': '',
-                    'Donation Context': profile.get('context', '')
-                }
-
-                # Add emails for this profile
-                emails = profile.get('Emails', [])
-                if not isinstance(emails, list):
-                    emails = [emails] if emails else []
-                # Also scan for obfuscated emails in any text fields
-                for field in ['name', 'source', 'context']:
-                    if field in profile and isinstance(profile[field], str):
-                        emails.extend(CSVExporter.extract_and_normalize_emails(profile[field]))
-                emails = list(set(emails))
-                for email in emails:
-                    if isinstance(email, str) and CSVExporter.is_valid_email(email):
-                        row = base_row.copy()
-                        row['Email'] = email
-                        row['Type'] = 'email'
-                        rows.append(row)
-
-                # Add phone numbers for this profile
-                phones = profile.get('PhoneNumbers', [])
-                if not isinstance(phones, list):
-                    phones = [phones] if phones else []
-                for phone in phones:
-                    if isinstance(phone, str):
-                        normalized_phone = CSVExporter.normalize_phone_number(phone)
-                        if normalized_phone:
-                            row = base_row.copy()
-                            row['Phone'] = normalized_phone
-                            row['Type'] = 'phone'
-                            rows.append(row)
-
-                # Add addresses for this profile
-                addresses = profile.get('Addresses', [])
-                if not isinstance(addresses, list):
-                    addresses = [addresses] if addresses else []
-                for address in addresses:
-                    if isinstance(address, str):
-                        cleaned_address = CSVExporter.clean_field(address)
-                        if cleaned_address:
-                            row = base_row.copy()
-                            row['Address'] = cleaned_address
-                            row['Type'] = 'address'
-                            rows.append(row)
-
-                # Add donations for this profile
-                donations = profile.get('Donations', [])
-                if not isinstance(donations, list):
-                    donations = [donations] if donations else []
-                for donation in donations:
-                    if isinstance(donation, dict) and 'amount' in donation:
-                        row = base_row.copy()
-                        row['Donation Amount'] = donation['amount']
-                        row['Donation Context'] = donation.get('context', '')
-                        row['Type'] = 'donation'
-                        rows.append(row)
-
-            # Add standalone emails
-            for email in data_dict.get('Emails', []):
-                # Also scan for obfuscated emails in the email string
-                found_emails = CSVExporter.extract_and_normalize_emails(email) if isinstance(email, str) else []
-                for em in found_emails:
-                    if CSVExporter.is_valid_email(em):
-                        row = {
-                            'Name': '',
-                            'First Name': '',
-                            'Last Name': '',
-                            'Source URL': url,
-                            'Type': 'email',
-                            'Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'Email': em,
-                            'Phone': '',
-                            'Address': '',
-                            'Donation Amount': '',
-                            'Donation Context': ''
-                        }
-                        rows.append(row)
-
-            # Add standalone phone numbers
-            for phone in data_dict.get('PhoneNumbers', []):
-                if isinstance(phone, str):
-                    normalized_phone = CSVExporter.normalize_phone_number(phone)
-                    if normalized_phone:
-                        row = {
-                            'Name': '',
-                            'First Name': '',
-                            'Last Name': '',
-                            'Source URL': url,
-                            'Type': 'phone',
-                            'Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'Email': '',
-                            'Phone': normalized_phone,
-                            'Address': '',
-                            'Donation Amount': '',
-                            'Donation Context': ''
-                        }
-                        rows.append(row)
-
-            # Add standalone addresses
-            for address in data_dict.get('Addresses', []):
-                if isinstance(address, str):
-                    cleaned_address = CSVExporter.clean_field(address)
-                    if cleaned_address:
-                        row = {
-                            'Name': '',
-                            'First Name': '',
-                            'Last Name': '',
-                            'Source URL': url,
-                            'Type': 'address',
-                            'Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                            'Email': '',
-                            'Phone': '',
-                            'Address': cleaned_address,
-                            'Donation Amount': '',
-                            'Donation Context': ''
-                        }
-                        rows.append(row)
-
-            # Add standalone donations
-            for donation in data_dict.get('Donations', []):
-                if isinstance(donation, dict) and 'amount' in donation:
-                    row = {
-                        'Name': '',
-                        'First Name': '',
-                        'Last Name': '',
-                        'Source URL': url,
-                        'Type': 'donation',
-                        'Date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'Email': '',
-                        'Phone': '',
-                        'Address': '',
-                        'Donation Amount': donation['amount'],
-                        'Donation Context': donation.get('context', '')
-                    }
-                    rows.append(row)
-            
-            # Write to CSV
-            if rows:
-                with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                    # Ensure all fieldnames are present in every row
-                    fieldnames = [
-                        'Name', 'First Name', 'Last Name', 'Source URL', 'Type', 'Date',
-                        'Email', 'Phone', 'Address',
-                        'Donation Amount', 'Donation Context'
-                    ]
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames, extrasaction='ignore')
-                    writer.writeheader()
-                    for row in rows:
-                        # Fill missing fields with empty string
-                        for field in fieldnames:
-                            if field not in row:
-                                row[field] = ''
-                        writer.writerow(row)
-                logging.info(f"Successfully saved data to {filename}")
-                return filename
-            else:
+            if isinstance(data_dict, (bytes, str)):
+                data_dict = orjson.loads(data_dict)
+
+            # One timestamp for the whole export rather than one per row
+            now = datetime.now()
+            now_str = now.strftime('%Y-%m-%d %H:%M:%S')
+
+            # Stream rows straight into the writer instead of collecting them first.
+            # Pulling the first row up front lets empty exports return before touching the disk.
+            rows = CSVExporter._iter_rows(data_dict, url, now_str)
+            first_row = next(rows, None)
+            if first_row is None:
                 logging.warning("No data to export")
                 return None
+
+            # Create a sanitized filename from the URL
+            domain, directory = _domain_for(url)
+            os.makedirs(directory, exist_ok=True)
+            filename = os.path.join(directory, f"{domain}_donor_data_{now.strftime('%Y%m%d_%H%M%S')}{suffix}.csv")
+
+            # A 1 MiB buffer batches the many small row writes into few syscalls
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(FIELDNAMES)
+                writer.writerow(first_row)
+                writer.writerows(rows)
+            logging.info(f"Successfully saved data to {filename}")
+            return filename
                 
         except Exception as e:
             logging.error(f"Error saving CSV: {str(e)}", exc_info=True)
@@ -2,6 +2,7 @@ from parsers.WordPressExtractor import WordPressExtractor
 from parsers.GoogleExtractor import GoogleExtractor
 from parsers.MicrosoftExtractor import MicrosoftExtractor
 from .DataManager import DataManager
+from .CSVExporter import CSVExporter
 import logging
 from datetime import datetime
 
@@ -17,6 +18,39 @@ class ContactParser:
         self.data_manager = data_manager or DataManager()
         self.contacts = self.data_manager.card_dict
 
+    @staticmethod
+    def _normalize_extractor_output(raw):
+        """
+        Return the per-contact dicts from an extractor result.
+
+        WordPress and Microsoft return a dict with a 'profiles' list, Google returns the list itself.
+        """
+        if isinstance(raw, dict):
+            raw = raw.get('profiles') or []
+        elif not isinstance(raw, list):
+            return []
+        return [contact for contact in raw if isinstance(contact, dict)]
+
+    @staticmethod
+    def _valid_emails(emails):
+        """
+        Keep only the well-formed email addresses.
+        """
+        return [email for email in emails if isinstance(email, str) and CSVExporter.is_valid_email(email)]
+
+    @staticmethod
+    def _normalized_phones(phones):
+        """
+        Normalize US-style phone numbers. Numbers the normalizer does not recognise, such as
+        E.164 or other international formats, are kept as given; only values without a digit are dropped.
+        """
+        normalized = []
+        for phone in phones:
+            if not isinstance(phone, str) or not any(char.isdigit() for char in phone):
+                continue
+            normalized.append(CSVExporter.normalize_phone_number(phone) or phone.strip())
+        return normalized
+
     def fetch_contacts(self, system, **kwargs):
         """
         Fetches contacts from the specified system.
@@ -52,38 +86,42 @@ class ContactParser:
                 # Deduplicate each list
                 self.contacts[key] = list(dict.fromkeys(self.contacts[key]))
 
-        # Update our internal data structure
-        profiles_list = contacts.get('profiles') if isinstance(contacts, dict) else contacts
-        self.contacts['profiles'].extend([
-            {
-                'name': contact.get('name', ''),
-                'emails': contact.get('emails', []),
-                'phone_numbers': contact.get('phone_numbers', []),
-                'addresses': contact.get('addresses', []),
-                'source': system,
-                'fetched_at': datetime.now().isoformat()
-            }
-            for contact in profiles_list
-        ])
-        # Deduplicate profiles by name
-        seen_names = set()
-        unique_profiles = []
+        # Update our internal data structure, deduplicating profiles by name in the same pass.
+        # Emails and phone numbers are validated here, once, as they are ingested.
+        # The first profile seen for a name wins; profiles without a name are dropped.
+        profiles_by_name = {}
         for profile in self.contacts['profiles']:
-            if profile['name'] and profile['name'] not in seen_names:
-                unique_profiles.append(profile)
-                seen_names.add(profile['name'])
-        self.contacts['profiles'] = unique_profiles
+            if profile['name']:
+                profiles_by_name.setdefault(profile['name'], profile)
+        for contact in ContactParser._normalize_extractor_output(contacts):
+            name = contact.get('name', '')
+            if name and name not in profiles_by_name:
+                profiles_by_name[name] = {
+                    'name': name,
+                    'emails': ContactParser._valid_emails(contact.get('emails', [])),
+                    'phone_numbers': ContactParser._normalized_phones(contact.get('phone_numbers', [])),
+                    'addresses': contact.get('addresses', []),
+                    'source': system,
+                    'fetched_at': datetime.now().isoformat()
+                }
+        self.contacts['profiles'] = list(profiles_by_name.values())
 
-        # Also update the individual collections
-        for profile in self.contacts['profiles']:
+        # Also update the individual collections, checking membership against sets
+        seen_emails = set(self.contacts['emails'])
+        seen_phones = set(self.contacts['phone_numbers'])
+        seen_addresses = set(self.contacts['addresses'])
+        for profile in profiles_by_name.values():
             for email in profile.get('emails', []):
-                if email and email not in self.contacts['emails']:
+                if email and email not in seen_emails:
+                    seen_emails.add(email)
                     self.contacts['emails'].append(email)
             for phone in profile.get('phone_numbers', []):
-                if phone and phone not in self.contacts['phone_numbers']:
+                if phone and phone not in seen_phones:
+                    seen_phones.add(phone)
                     self.contacts['phone_numbers'].append(phone)
             for address in profile.get('addresses', []):
-                if address and address not in self.contacts['addresses']:
+                if address and address not in seen_addresses:
+                    seen_addresses.add(address)
                     self.contacts['addresses'].append(address)
 
         return self.contacts
@@ -98,35 +136,24 @@ class ContactParser:
         import csv
         try:
             with open(filename, 'w', newline='') as csvfile:
-                fieldnames = ['Name', 'Email', 'Phone', 'Address', 'Source', 'Fetched At']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+                # Rows are tuples in header order (Name, Email, Phone, Address, Source, Fetched At)
+                writer = csv.writer(csvfile)
+                writer.writerow(('Name', 'Email', 'Phone', 'Address', 'Source', 'Fetched At'))
                 
                 # Write profiles
                 for profile in self.contacts['profiles']:
-                    base_row = {
-                        'Name': profile.get('name', ''),
-                        'Source': profile.get('source', ''),
-                        'Fetched At': profile.get('fetched_at', '')
-                    }
+                    name = profile.get('name', '')
+                    source = profile.get('source', '')
+                    fetched_at = profile.get('fetched_at', '')
                     
                     # Write emails
-                    for email in profile.get('emails', []):
-                        row = base_row.copy()
-                        row['Email'] = email
-                        writer.writerow(row)
+                    writer.writerows((name, email, '', '', source, fetched_at) for email in profile.get('emails', []))
                     
                     # Write phone numbers
-                    for phone in profile.get('phone_numbers', []):
-                        row = base_row.copy()
-                        row['Phone'] = phone
-                        writer.writerow(row)
+                    writer.writerows((name, '', phone, '', source, fetched_at) for phone in profile.get('phone_numbers', []))
                     
                     # Write addresses
-                    for address in profile.get('addresses', []):
-                        row = base_row.copy()
-                        row['Address'] = address
-                        writer.writerow(row)
+                    writer.writerows((name, '', '', address, source, fetched_at) for address in profile.get('addresses', []))
             
             logging.info(f"Saved contacts to {filename}")
         except Exception as e:
@@ -1,7 +1,119 @@
 import logging
 import os
 import json
-from datetime import datetime
+import orjson
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Written into extracted_data.json so files produced by save_to_file can be recognized on load
+SCHEMA_VERSION = 1
+
+def _to_list(field, value):
+    """Wrap or convert a non-list field value into a list."""
+    if isinstance(value, set):
+        return list(value)
+    if isinstance(value, (dict, str)):
+        return [value]
+    try:
+        return list(value)
+    except TypeError:
+        logger.debug("Type error converting %s, using single item list", field)
+        return [value]
+
+def _clean_one_profile(profile):
+    """Convert any nested sets in a profile or donor dict to lists, in place."""
+    for key, val in profile.items():
+        if isinstance(val, set):
+            profile[key] = list(val)
+    return profile
+
+def _clean_dictlist(value):
+    """Keep only the dict items, converting any nested sets to lists."""
+    return [_clean_one_profile(item) for item in value if isinstance(item, dict)]
+
+def _extend_unique(target, items):
+    """Append the items not already in target, keeping order."""
+    seen = set(target)
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            target.append(item)
+
+def _clean_strlist(value):
+    """Convert to strings and remove duplicates in one pass."""
+    return list(dict.fromkeys(map(str, value)))
+
+def _name_key(name):
+    """Case- and whitespace-insensitive key for a profile name."""
+    return name.strip().lower() if isinstance(name, str) else name
+
+def _latest_iso(*timestamps):
+    """
+    Return the latest of several naive ISO-8601 timestamps, in 'T'-separated form.
+
+    ISO-8601 strings sort chronologically, so no parsing is needed once the
+    space separator used by DonorProfile.to_dict is normalized to 'T'.
+    """
+    return max(timestamp.replace(' ', 'T', 1) for timestamp in timestamps)
+
+def _canonical_key(item):
+    """Hashable key for a possibly nested dict, equal for equal dicts."""
+    return json.dumps(item, sort_keys=True, default=str)
+
+# consolidate_data fields collected as sets, and dict fields deduplicated by canonical key
+_CONSOLIDATED_SET_FIELDS = ('Emails', 'Phones', 'Names', 'Addresses', 'PDFLinks')
+_CONSOLIDATED_DICT_FIELDS = ('Donations', 'Entities')
+_PROFILE_LIST_KEYS = ('emails', 'phone_numbers', 'addresses', 'donations')
+
+def _merge_profile(existing_profile, profile):
+    """Merge a profile into an existing one with the same name."""
+    for key in ('emails', 'phone_numbers', 'addresses'):
+        _extend_unique(existing_profile.setdefault(key, []), profile.get(key, []))
+    existing_profile.setdefault('donations', []).extend(profile.get('donations', []))
+    existing_profile['last_seen'] = _latest_iso(existing_profile['last_seen'], profile['last_seen'])
+
+def _consolidate_source(data):
+    """
+    Reduce a single source for consolidate_data.
+
+    Returns (profiles by name, set fields, (key, item) pairs for the dict fields).
+    Profiles are copied so that merging never mutates the caller's data.
+    """
+    profiles_by_name = {}
+    for profile in data.get('Profiles', []):
+        existing_profile = profiles_by_name.get(profile['name'])
+        if existing_profile is None:
+            profiles_by_name[profile['name']] = {
+                **profile, **{key: list(profile[key]) for key in _PROFILE_LIST_KEYS if key in profile}
+            }
+        else:
+            _merge_profile(existing_profile, profile)
+
+    source_sets = {field: set(data.get(field, [])) for field in _CONSOLIDATED_SET_FIELDS}
+    source_items = {}
+    for field in _CONSOLIDATED_DICT_FIELDS:
+        keyed_items = {}
+        for item in data.get(field, []):
+            keyed_items.setdefault(_canonical_key(item), item)
+        source_items[field] = list(keyed_items.items())
+    return profiles_by_name, source_sets, source_items
+
+def _keep_list(value):
+    return value
+
+# Allowed fields and how each one is cleaned
+_CLEANERS = {
+    'Profiles': _clean_dictlist,
+    'Emails': _clean_strlist,
+    'PhoneNumbers': _clean_strlist,
+    'Addresses': _clean_strlist,
+    'Donations': _keep_list,
+    'Names': _clean_strlist,
+    'PDFLinks': _clean_strlist,
+    'Entities': _keep_list,
+    'Donors': _clean_dictlist
+}
 
 class DataManager:
     def __init__(self):
@@ -17,7 +129,13 @@ class DataManager:
             'Entities': [],       # List of entity dictionaries
             'Donors': []          # List of donor dictionaries
         }
-        logging.info("Initialized DataManager with comprehensive data structure")
+        # mtime of each file as last written by save_to_file, to skip re-merging unchanged files
+        self._saved_mtimes = {}
+        # Persistent name key -> item index for 'Profiles' and 'Donors', stored with the list it
+        # indexes. Appends made here (update_data, including save_to_file reloads) keep it current;
+        # a list reassigned in card_dict by another module is no longer that list, so it is reindexed.
+        self._names_by_field = {}
+        logger.info("Initialized DataManager with comprehensive data structure")
 
     @staticmethod
     def clean_data(data):
@@ -33,95 +151,44 @@ class DataManager:
         if not isinstance(data, dict):
             raise ValueError("Data must be a dictionary")
 
-        # Log the incoming data structure
-        logging.debug(f"Cleaning data: {json.dumps(data, default=str)}")
-
-        # Define allowed fields and their types
-        allowed_fields = {
-            'Profiles': list,
-            'Emails': list,
-            'PhoneNumbers': list,
-            'Addresses': list,
-            'Donations': list,
-            'Names': list,
-            'PDFLinks': list,
-            'Entities': list,
-            'Donors': list
-        }
+        # Log a summary of the incoming data rather than serializing all of it
+        logger.debug("Cleaning data with fields: %s", list(data))
 
         cleaned_data = {}
         
-        # Clean each field
-        for field, expected_type in allowed_fields.items():
+        # Clean each allowed field with its cleaner
+        for field, cleaner in _CLEANERS.items():
             if field in data:
                 value = data[field]
-                logging.debug(f"Processing field {field} with value: {value}")
+                logger.debug("Processing field %s with value: %s", field, value)
                 
                 # Convert any non-list values to lists
-                if not isinstance(value, expected_type):
-                    logging.debug(f"Converting {field} to list")
-                    if isinstance(value, set):
-                        value = list(value)
-                    elif isinstance(value, dict):
-                        value = [value]
-                    elif isinstance(value, str):
-                        value = [value]
-                    else:
-                        try:
-                            value = list(value)
-                        except TypeError:
-                            logging.debug(f"Type error converting {field}, using single item list")
-                            value = [value]
-                
-                # Ensure we have a list
                 if not isinstance(value, list):
-                    value = [value]
-                
-                if field == 'Profiles':
-                    cleaned_profiles = []
-                    for profile in value:
-                        if isinstance(profile, dict):
-                            # Convert any nested sets to lists
-                            for key, val in profile.items():
-                                if isinstance(val, set):
-                                    logging.debug(f"Converting nested set in profile {key}")
-                                    profile[key] = list(val)
-                            cleaned_profiles.append(profile)
-                    value = cleaned_profiles
-                elif field in ['Emails', 'PhoneNumbers', 'Addresses', 'Names', 'PDFLinks']:
-                    # Convert to strings and remove duplicates
-                    value = list(dict.fromkeys(str(item) for item in value))
-                elif field == 'Donors':
-                    # Special handling for Donors field
-                    cleaned_donors = []
-                    for donor in value:
-                        if isinstance(donor, dict):
-                            # Convert any nested sets to lists
-                            for key, val in donor.items():
-                                if isinstance(val, set):
-                                    logging.debug(f"Converting nested set in donor {key}")
-                                    donor[key] = list(val)
-                            cleaned_donors.append(donor)
-                    value = cleaned_donors
+                    logger.debug("Converting %s to list", field)
+                    value = _to_list(field, value)
                 
+                value = cleaner(value)
                 cleaned_data[field] = value
-                logging.debug(f"Cleaned {field}: {value}")
+                logger.debug("Cleaned %s: %s", field, value)
 
-        logging.debug(f"Final cleaned data: {json.dumps(cleaned_data, default=str)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Final cleaned data sizes: %s", {field: len(value) for field, value in cleaned_data.items()})
         return cleaned_data
 
-    def update_data(self, data):
+    def update_data(self, data, _trusted=False):
         """
         Update the card_dict with new data, ensuring no duplicates and validating input.
 
         Args:
             data (dict): A dictionary containing new data to merge.
+            _trusted (bool): The data was written by save_to_file in the current schema,
+                so its field types are already correct and clean_data is skipped.
         """
-        logging.info(f"Updating card_dict with new data")
+        logger.info("Updating card_dict with new data")
 
         try:
             # First clean the incoming data to ensure consistency
-            cleaned_data = self.clean_data(data)
+            cleaned_data = data if _trusted else self.clean_data(data)
 
             # Safeguard: Only add truly new items (by unique key) to each field
             for field in self.card_dict:
@@ -131,29 +198,35 @@ class DataManager:
                         cleaned_data[field] = [cleaned_data[field]]
                     # Only add items not already present
                     if field in ['Profiles', 'Donors']:
-                        # For profiles/donors, use 'name' as unique key
-                        existing_names = {item.get('name') for item in self.card_dict[field] if isinstance(item, dict)}
+                        # For profiles/donors, use 'name' as unique key, ignoring case and surrounding whitespace
+                        existing_names = self._names_for(field)
                         for item in cleaned_data[field]:
-                            if isinstance(item, dict) and item.get('name') and item.get('name') not in existing_names:
+                            if isinstance(item, dict) and item.get('name'):
+                                name_key = _name_key(item['name'])
+                                if name_key not in existing_names:
+                                    self.card_dict[field].append(item)
+                                    existing_names[name_key] = item
+                    elif field in ['Donations', 'Entities']:
+                        # Dicts are unhashable, so compare them by a canonical key
+                        existing_items = {_canonical_key(item) for item in self.card_dict[field]}
+                        for item in cleaned_data[field]:
+                            key = _canonical_key(item)
+                            if key not in existing_items:
                                 self.card_dict[field].append(item)
-                                existing_names.add(item.get('name'))
+                                existing_items.add(key)
                     else:
-                        # For simple lists, only add new unique items
+                        # For string lists (already str from clean_data), only add new unique items
                         existing_items = set(self.card_dict[field])
                         for item in cleaned_data[field]:
-                            if isinstance(item, dict):
-                                key = str(item)
-                            else:
-                                key = str(item)
-                            if key not in existing_items:
+                            if item not in existing_items:
                                 self.card_dict[field].append(item)
-                                existing_items.add(key)
-            logging.info("Safeguard: Only new data added to card_dict.")
+                                existing_items.add(item)
+            logger.info("Safeguard: Only new data added to card_dict.")
         except Exception as e:
-            logging.error(f"Error updating data: {str(e)}")
+            logger.error("Error updating data: %s", e)
             raise
 
-        logging.debug(f"Updated card_dict")
+        logger.debug("Updated card_dict")
 
     def add_donor_profile(self, profile):
         """
@@ -163,40 +236,62 @@ class DataManager:
             profile (dict): A donor profile dictionary.
         """
         # Clean the profile data
-        profile = self.clean_data({'Profiles': [profile]})['Profiles'][0]
+        profile = _clean_one_profile(profile)
 
         # Check for existing profile with same name
-        existing_profile = None
-        for idx, existing in enumerate(self.card_dict['Profiles']):
-            if existing.get('name') == profile.get('name'):
-                existing_profile = existing
-                break
+        existing_profile = self._existing_profile(profile.get('name'))
 
         if existing_profile:
             # Merge profiles with proper list handling
-            # Remove duplicates while merging
-            existing_profile['emails'] = list(dict.fromkeys(existing_profile['emails'] + profile['emails']))
-            existing_profile['phone_numbers'] = list(dict.fromkeys(existing_profile['phone_numbers'] + profile['phone_numbers']))
-            existing_profile['addresses'] = list(dict.fromkeys(existing_profile['addresses'] + profile['addresses']))
+            # Remove duplicates while merging, extending the existing lists in place
+            for key in ('emails', 'phone_numbers', 'addresses'):
+                if profile.get(key):
+                    _extend_unique(existing_profile.setdefault(key, []), profile[key])
             
             # For donations, we want to keep all entries
-            existing_profile['Donations'].extend(profile['Donations'])
+            if profile.get('donations'):
+                existing_profile.setdefault('donations', []).extend(profile['donations'])
             
             # Update timestamps
-            existing_profile['last_seen'] = max(
-                datetime.fromisoformat(existing_profile.get('last_seen', '1970-01-01T00:00:00')),
-                datetime.fromisoformat(profile.get('last_seen', '1970-01-01T00:00:00'))
-            ).isoformat()
-            
-            # Ensure all lists are unique
-            existing_profile['Emails'] = list(dict.fromkeys(existing_profile['Emails']))
-            existing_profile['PhoneNumbers'] = list(dict.fromkeys(existing_profile['PhoneNumbers']))
-            existing_profile['Addresses'] = list(dict.fromkeys(existing_profile['Addresses']))
-            logging.info(f"Merged donor profile: {profile['name']}")
+            existing_profile['last_seen'] = _latest_iso(
+                existing_profile.get('last_seen', '1970-01-01T00:00:00'),
+                profile.get('last_seen', '1970-01-01T00:00:00')
+            )
+            logger.info("Merged donor profile: %s", profile['name'])
         else:
             # Add new profile
             self.card_dict['Profiles'].append(profile)
-            logging.info(f"Added new donor profile: {profile['name']}")
+            self._names_for('Profiles').setdefault(_name_key(profile.get('name')), profile)
+            logger.info("Added new donor profile: %s", profile['name'])
+
+    def _names_for(self, field):
+        """
+        Return the persistent index of card_dict[field] by name key, keeping the first item for each key.
+
+        Args:
+            field (str): 'Profiles' or 'Donors'.
+        """
+        items = self.card_dict[field]
+        indexed = self._names_by_field.get(field)
+        # The index holds a reference to its list, so an identity check cannot be fooled by a reused id
+        if indexed is None or indexed[0] is not items:
+            names = {}
+            for item in items:
+                if isinstance(item, dict):
+                    names.setdefault(_name_key(item.get('name')), item)
+            indexed = self._names_by_field[field] = (items, names)
+        return indexed[1]
+
+    def _existing_profile(self, name):
+        """
+        Return the first profile in card_dict with the given name, compared as update_data
+        does (ignoring case and surrounding whitespace), or None.
+
+        Args:
+            name (str): The profile name to look up.
+        """
+        # O(1) lookup in the name index that update_data and add_donor_profile keep current
+        return self._names_for('Profiles').get(_name_key(name))
 
     def save_to_file(self, directory):
         """
@@ -210,18 +305,21 @@ class DataManager:
         filename = os.path.join(directory, 'extracted_data.json')
         
         try:
-            # If file exists, load existing data and merge
-            if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8') as f:
-                    existing_data = json.load(f)
+            # If file exists, load existing data and merge. A file we wrote ourselves and that
+            # has not changed since is already contained in card_dict, so skip the round-trip.
+            if os.path.exists(filename) and self._saved_mtimes.get(filename) != os.stat(filename).st_mtime_ns:
+                with open(filename, 'rb') as f:
+                    existing_data = orjson.loads(f.read())
                 
-                # Only add new data (safeguard)
-                self.update_data(existing_data)
+                # Only add new data (safeguard); our own files need no re-cleaning
+                trusted = isinstance(existing_data, dict) and existing_data.get('__schema_version__') == SCHEMA_VERSION
+                self.update_data(existing_data, _trusted=trusted)
         except Exception as e:
-            logging.warning(f"Error loading existing data: {e}")
+            logger.warning("Error loading existing data: %s", e)
 
         # Prepare data for JSON serialization
         serializable_dict = {
+            '__schema_version__': SCHEMA_VERSION,
             'Profiles': self.card_dict['Profiles'],
             'Emails': self.card_dict['Emails'],
             'PhoneNumbers': self.card_dict['PhoneNumbers'],
@@ -233,17 +331,22 @@ class DataManager:
         }
         
         # Write to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(serializable_dict, f, indent=2, ensure_ascii=False)
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(serializable_dict, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        self._saved_mtimes[filename] = os.stat(filename).st_mtime_ns
         
-        logging.info(f"Saved data to {filename}")
+        logger.info("Saved data to %s", filename)
 
-    def consolidate_data(self, data_list):
+    def consolidate_data(self, data_list, max_workers=1):
         """
         Consolidates data from multiple sources, ensuring proper associations and deduplication.
 
+        Each source is first reduced on its own, then the per-source results are merged in order.
+        The first phase is independent per source, so it can run in worker processes.
+
         Args:
             data_list (list): List of data dictionaries to consolidate.
+            max_workers (int): Processes to reduce sources with; 1 reduces them in this process.
         """
         consolidated_data = {
             'Profiles': [],
@@ -256,62 +359,34 @@ class DataManager:
             'Entities': []
         }
 
-        for data in data_list:
+        if max_workers > 1 and len(data_list) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                partials = list(executor.map(_consolidate_source, data_list))
+        else:
+            partials = map(_consolidate_source, data_list)
+
+        # Index profiles by name and keep seen-sets for the dict fields, so every lookup is O(1)
+        profiles_by_name = {}
+        seen = {field: set() for field in _CONSOLIDATED_DICT_FIELDS}
+
+        for source_profiles, source_sets, source_items in partials:
             # Add donor profiles
-            if 'Profiles' in data:
-                for profile in data['Profiles']:
-                    for idx, existing in enumerate(consolidated_data['Profiles']):
-                        if existing['name'] == profile['name']:
-                            existing_profile = existing
-                            break
-
-                    if existing_profile:
-                        # Merge profiles
-                        existing_profile['emails'].update(profile['emails'])
-                        existing_profile['phone_numbers'].update(profile['phone_numbers'])
-                        existing_profile['addresses'].update(profile['addresses'])
-                        existing_profile['donations'].extend(profile['donations'])
-                        existing_profile['last_seen'] = max(
-                            datetime.fromisoformat(existing_profile['last_seen']),
-                            datetime.fromisoformat(profile['last_seen'])
-                        ).isoformat()
-                    else:
-                        consolidated_data['Profiles'].append(profile)
+            for name, profile in source_profiles.items():
+                existing_profile = profiles_by_name.get(name)
+                if existing_profile is None:
+                    profiles_by_name[name] = profile
+                    consolidated_data['Profiles'].append(profile)
+                else:
+                    _merge_profile(existing_profile, profile)
 
             # Add other data
-            emails = data.get('Emails', [])
-            for email in emails:
-                if email not in consolidated_data['Emails']:
-                    consolidated_data['Emails'].append(email)
-
-            phones = data.get('Phones', [])
-            for phone in phones:
-                if phone not in consolidated_data['Phones']:
-                    consolidated_data['Phones'].append(phone)
-
-            donations = data.get('Donations', [])
-            for donation in donations:
-                if donation not in consolidated_data['Donations']:
-                    consolidated_data['Donations'].append(donation)
-
-            names = data.get('Names', [])
-            for name in names:
-                if name not in consolidated_data['Names']:
-                    consolidated_data['Names'].append(name)
-
-            addresses = data.get('Addresses', [])
-            for address in addresses:
-                if address not in consolidated_data['Addresses']:
-                    consolidated_data['Addresses'].append(address)
-
-            pdf_links = data.get('PDFLinks', [])
-            for pdf_link in pdf_links:
-                if pdf_link not in consolidated_data['PDFLinks']:
-                    consolidated_data['PDFLinks'].append(pdf_link)
-
-            entities = data.get('Entities', [])
-            for entity in entities:
-                if entity not in consolidated_data['Entities']:
-                    consolidated_data['Entities'].append(entity)
-
-        return consolidated_data
\ No newline at end of file
+            for field, values in source_sets.items():
+                consolidated_data[field] |= values
+
+            for field, keyed_items in source_items.items():
+                for key, item in keyed_items:
+                    if key not in seen[field]:
+                        seen[field].add(key)
+                        consolidated_data[field].append(item)
+
+        return consolidated_data
@@ -1,17 +1,63 @@
 import re
+import sys
 from datetime import datetime
 import logging
 
+try:
+    # google-re2 matches in linear time, which keeps bulk classification of scraped strings bounded
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+logger = logging.getLogger(__name__)
+
+# Validation patterns, compiled once instead of on every add_* call
+_LOOSE_EMAIL_RE = re.compile(r'@.+\.')
+_NONDIGIT_RE = re.compile(r'\D')
+_DIGIT_RE = re.compile(r'\d')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_RE = re.compile(r'\+?[1-9]\d{1,2}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_ADDRESS_RE = re.compile(r'\d{1,5}\s\w+(\s\w+)*,\s\w+(\s\w+)*,\s[A-Z]{2}\s\d{5}')
+# The three strict patterns fused so bulk_add classifies each candidate with a single match
+_CONTACT_KIND_RE = _regex.compile(
+    r'(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$)'
+    r'|(?P<phone>\+?[1-9]\d{1,2}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})'
+    r'|(?P<address>\d{1,5}\s\w+(?:\s\w+)*,\s\w+(?:\s\w+)*,\s[A-Z]{2}\s\d{5})'
+)
+
+# Donation context keyword -> donation type
+_DONATION_KEYWORDS = {
+    'monthly': 'recurring', 'recurring': 'recurring', 'regular': 'recurring',
+    'one-time': 'one-time', 'single': 'one-time', 'special': 'one-time',
+    'pledge': 'pledge', 'promise': 'pledge', 'commitment': 'pledge',
+}
+_DONATION_TYPE_RE = re.compile('|'.join(map(re.escape, _DONATION_KEYWORDS)))
+
+def _intern_str(value):
+    # Sources and names repeat across thousands of items; interning shares one string object for each
+    return sys.intern(value) if isinstance(value, str) else value
+
 class DonorProfile:
+    # Many profiles are alive at once during aggregation; slots drop the per-instance __dict__
+    __slots__ = (
+        'name', 'source_url', 'emails', 'phone_numbers', 'addresses', 'donations',
+        'first_seen', 'last_seen', 'metadata', 'raw_emails', 'raw_phone_numbers', 'raw_addresses',
+        '_emails_set', '_phones_set', '_addresses_set',
+        '_raw_emails_set', '_raw_phones_set', '_raw_addresses_set',
+        '_email_sources_set', '_phone_sources_set', '_address_sources_set',
+        '_donations_set'
+    )
+
     def __init__(self, name=None, source_url=None):
-        self.name = name
-        self.source_url = source_url
+        self.name = _intern_str(name)
+        self.source_url = _intern_str(source_url)
         self.emails = []  # Changed from set to list
         self.phone_numbers = []  # Changed from set to list
         self.addresses = []  # Changed from set to list
         self.donations = []
-        self.first_seen = datetime.now()
-        self.last_seen = datetime.now()
+        now = datetime.now()
+        self.first_seen = now
+        self.last_seen = now
         self.metadata = {
             'organization': None,
             'campaigns': [],  # Changed from set to list
@@ -24,91 +70,151 @@ class DonorProfile:
         self.raw_emails = []
         self.raw_phone_numbers = []
         self.raw_addresses = []
+        # Set indexes mirroring the lists above, so dedup checks are O(1) while the lists keep insertion order
+        self._emails_set = set()
+        self._phones_set = set()
+        self._addresses_set = set()
+        self._raw_emails_set = set()
+        self._raw_phones_set = set()
+        self._raw_addresses_set = set()
+        self._email_sources_set = set()
+        self._phone_sources_set = set()
+        self._address_sources_set = set()
+        self._donations_set = set()
 
-    def add_email(self, email, source=None):
-        if email not in self.raw_emails:
+    def add_email(self, email, source=None, now=None):
+        source = _intern_str(source)
+        if email not in self._raw_emails_set:
+            self._raw_emails_set.add(email)
             self.raw_emails.append(email)
         if self._loose_validate_email(email):
-            if email not in self.emails:
+            # Emails differing only in case or surrounding spaces are the same address;
+            # the canonical form is stored and the original stays in raw_emails
+            email = email.strip().lower()
+            if email not in self._emails_set:
+                self._emails_set.add(email)
                 self.emails.append(email)
-            if source and source not in self.metadata['email_sources']:
+            if source and source not in self._email_sources_set:
+                self._email_sources_set.add(source)
                 self.metadata['email_sources'].append(source)
-            self.last_seen = datetime.now()
+            self.last_seen = now or datetime.now()
         else:
-            logging.warning(f"Rejected email (format): {email}")
+            logger.warning(f"Rejected email (format): {email}")
 
-    def add_phone(self, phone, source=None):
-        if phone not in self.raw_phone_numbers:
+    def add_phone(self, phone, source=None, now=None):
+        source = _intern_str(source)
+        if phone not in self._raw_phones_set:
+            self._raw_phones_set.add(phone)
             self.raw_phone_numbers.append(phone)
         if self._loose_validate_phone(phone):
-            if phone not in self.phone_numbers:
+            # Dedup on the digits so '(415) 555-1212' and '415-555-1212' count once;
+            # the first formatting seen is the one kept
+            key = _NONDIGIT_RE.sub('', phone)
+            if key not in self._phones_set:
+                self._phones_set.add(key)
                 self.phone_numbers.append(phone)
-            if source and source not in self.metadata['phone_sources']:
+            if source and source not in self._phone_sources_set:
+                self._phone_sources_set.add(source)
                 self.metadata['phone_sources'].append(source)
-            self.last_seen = datetime.now()
+            self.last_seen = now or datetime.now()
         else:
-            logging.warning(f"Rejected phone (format): {phone}")
+            logger.warning(f"Rejected phone (format): {phone}")
 
-    def add_address(self, address, source=None):
-        if address not in self.raw_addresses:
+    def add_address(self, address, source=None, now=None):
+        source = _intern_str(source)
+        if address not in self._raw_addresses_set:
+            self._raw_addresses_set.add(address)
             self.raw_addresses.append(address)
         if self._loose_validate_address(address):
-            if address not in self.addresses:
+            if address not in self._addresses_set:
+                self._addresses_set.add(address)
                 self.addresses.append(address)
-            if source and source not in self.metadata['address_sources']:
+            if source and source not in self._address_sources_set:
+                self._address_sources_set.add(source)
                 self.metadata['address_sources'].append(source)
-            self.last_seen = datetime.now()
+            self.last_seen = now or datetime.now()
         else:
-            logging.warning(f"Rejected address (format): {address}")
+            logger.warning(f"Rejected address (format): {address}")
+
+    def bulk_add(self, candidates, source=None, now=None):
+        """
+        Classify scraped strings as email, phone or address and add each to the profile.
+
+        Strings matching none of the strict patterns are skipped.
+
+        Args:
+            candidates (iterable): Candidate strings from a crawled page.
+            source (str, optional): Where the strings were found.
+            now (datetime, optional): Timestamp for the whole batch.
+
+        Returns:
+            int: The number of candidates that were routed to add_email/add_phone/add_address.
+        """
+        now = now or datetime.now()
+        adders = {'email': self.add_email, 'phone': self.add_phone, 'address': self.add_address}
+        added = 0
+        for candidate in candidates:
+            match = _CONTACT_KIND_RE.match(candidate) if isinstance(candidate, str) else None
+            if match:
+                adders[match.lastgroup](candidate, source=source, now=now)
+                added += 1
+        return added
 
-    def add_donation(self, amount, source=None, context=None, date=None):
+    def add_donation(self, amount, source=None, context=None, date=None, now=None):
+        source = _intern_str(source)
+        # Bulk callers pass one `now` for the whole batch instead of reading the clock per item
+        now = now or datetime.now()
         donation = {
             'amount': amount,
             'source': source,
             'context': context,
-            'date': date or datetime.now().strftime('%Y-%m-%d'),
+            'date': date or now.strftime('%Y-%m-%d'),
             'type': self._determine_donation_type(context)
         }
-        if donation not in self.donations:
+        # Compare donations by their field values rather than scanning the list of dicts
+        key = (amount, source, context, donation['date'], donation['type'])
+        if key not in self._donations_set:
+            self._donations_set.add(key)
             self.donations.append(donation)
-        self.last_seen = datetime.now()
+        self.last_seen = now
 
-    def _loose_validate_email(self, email):
+    @staticmethod
+    def _loose_validate_email(email):
         # Accept anything with an @ and a dot after it
-        return bool(re.search(r'@.+\.', email))
+        return bool(_LOOSE_EMAIL_RE.search(email))
 
-    def _loose_validate_phone(self, phone):
+    @staticmethod
+    def _loose_validate_phone(phone):
         # Accept anything with at least 7 digits, ignore non-digit chars
-        digits = re.sub(r'\D', '', phone)
+        digits = _NONDIGIT_RE.sub('', phone)
         return len(digits) >= 7
 
-    def _loose_validate_address(self, address):
+    @staticmethod
+    def _loose_validate_address(address):
         # Accept anything with a number and at least one comma
-        return bool(re.search(r'\d', address)) and ',' in address
+        return bool(_DIGIT_RE.search(address)) and ',' in address
 
-    def _validate_email(self, email):
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+    @staticmethod
+    def _validate_email(email):
+        return bool(_EMAIL_RE.match(email))
 
-    def _validate_phone(self, phone):
-        pattern = r'\+?[1-9]\d{1,2}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        return bool(re.match(pattern, phone))
+    @staticmethod
+    def _validate_phone(phone):
+        return bool(_PHONE_RE.match(phone))
 
-    def _validate_address(self, address):
-        pattern = r'\d{1,5}\s\w+(\s\w+)*,\s\w+(\s\w+)*,\s[A-Z]{2}\s\d{5}'
-        return bool(re.match(pattern, address))
+    @staticmethod
+    def _validate_address(address):
+        return bool(_ADDRESS_RE.match(address))
 
     def _determine_donation_type(self, context):
         if not context:
             return 'unknown'
         
-        context = context.lower()
-        if any(word in context for word in ['monthly', 'recurring', 'regular']):
-            return 'recurring'
-        if any(word in context for word in ['one-time', 'single', 'special']):
-            return 'one-time'
-        if any(word in context for word in ['pledge', 'promise', 'commitment']):
-            return 'pledge'
+        # One scan for every keyword; the checks below keep the recurring > one-time > pledge precedence
+        found = {_DONATION_KEYWORDS[word] for word in _DONATION_TYPE_RE.findall(context.lower())}
+        for donation_type in ('recurring', 'one-time', 'pledge'):
+            if donation_type in found:
+                return donation_type
         return 'unknown'
 
     def to_dict(self):
@@ -1,14 +1,132 @@
 import imaplib
-import email
 from email.header import decode_header
+from email.parser import BytesParser
+from email.policy import compat32
 from urllib.parse import urlparse
 import os
 import csv
 import re
 import logging
+import functools
+from itertools import product
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from parsers.DonorProfile import DonorProfile
 
+try:
+    # google-re2 matches in linear time, which keeps scans of long scraped text bounded
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Contact patterns, fused into one alternation so each message is scanned once.
+# Earlier alternatives win at the same position, so an email claims its digits.
+_CONTACT_RE = _regex.compile(
+    r'(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,7})'
+    r'|(?P<address>\d{1,5}\s\w+(?:\s\w+)*,\s\w+,\s[A-Z]{2}\s\d{5})'  # Matches "123 Main St, City, ST 12345"
+    r'|(?P<phone>(?:\+?\d{1,2}[\s\xa0.-]?)?(?:\(?\d{3}\)?[\s\xa0.-]?)?\d{3}[\s\xa0.-]?\d{4})'  # Matches international and US phone numbers
+)
+# Names are matched separately, over the text left outside the contact matches, so a
+# capitalised word before an email cannot take its local part or an address its street.
+_NAME_RE = _regex.compile(r'\b[A-Z][a-z]+\s[A-Z][a-z]+\b')  # Matches "First Last"
+
+def _scan_contacts(text):
+    """
+    Scans text once and returns its contact matches keyed by kind ('email', 'name', 'address', 'phone').
+    """
+    found = {'email': [], 'name': [], 'address': [], 'phone': []}
+    outside = []
+    last = 0
+    for match in _CONTACT_RE.finditer(text):
+        found[match.lastgroup].append(match.group())
+        outside.append(text[last:match.start()])
+        last = match.end()
+    outside.append(text[last:])
+    found['name'] = _NAME_RE.findall('\x00'.join(outside))
+    return found
+
+@functools.lru_cache(maxsize=256)
+def _csv_filename(url):
+    """
+    Returns the contacts CSV name for a site URL, e.g. 'example_org_contacts.csv'.
+    """
+    return f"{urlparse(url).netloc.replace('.', '_')}_contacts.csv"
+
+def _iter_files(directory, extensions):
+    """
+    Yields paths of files under directory whose names end with one of extensions, in os.walk order.
+    Uses the file types scandir already read from the directory, so entries are not stat'ed again.
+    """
+    subdirectories = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif entry.name.endswith(extensions) and entry.is_file():
+                    yield entry.path
+    except OSError:
+        # Unreadable directories are skipped, as os.walk does
+        return
+    for subdirectory in subdirectories:
+        yield from _iter_files(subdirectory, extensions)
+
+def _scan_email_file(file_path):
+    """
+    Reads an email file and scans each message in it for contacts. Module-level so it can
+    run in worker processes.
+
+    Returns:
+        list: One dict of matches per message; an .mbox file is split on its 'From ' lines.
+            None if the file could not be read, so one bad file does not stop the others.
+    """
+    try:
+        # Mail files often carry stray non-UTF-8 bytes; replace them rather than fail the file
+        with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            content = f.read()
+    except OSError as e:
+        logging.error(f"Error reading email file '{file_path}': {e}")
+        return None
+    if not file_path.endswith('.mbox'):
+        return [_scan_contacts(content)]
+    # Each mbox message starts with a 'From ' envelope line; str.split finds them in C
+    parts = content.split('\nFrom ')
+    messages = parts[:1] + ['From ' + part for part in parts[1:]]
+    return [_scan_contacts(message) for message in messages if message.strip()]
+
+# UID in an IMAP FETCH response: in the envelope, e.g. b'3 (UID 42 BODY[] {1234}',
+# or, from some servers, in the bytes after the literal, e.g. b' UID 42)'
+_FETCH_UID_RE = re.compile(rb'\bUID (\d+)')
+
+def _decode_part(part):
+    """
+    Decodes a MIME part's payload with its declared charset, replacing undecodable bytes.
+    """
+    payload = part.get_payload(decode=True) or b''
+    charset = part.get_content_charset() or 'utf-8'
+    try:
+        return payload.decode(charset, errors='replace')
+    except LookupError:
+        # Unknown charset name in the header
+        return payload.decode('utf-8', errors='replace')
+
+def _first_text(message):
+    """
+    Returns the body of an email: its first text/plain part, or else its first text/html part.
+    Only the part that is returned gets decoded.
+    """
+    html_part = None
+    for part in message.walk():
+        content_type = part.get_content_type()
+        if content_type == "text/plain":
+            return _decode_part(part)
+        if content_type == "text/html" and html_part is None:
+            html_part = part
+    return _decode_part(html_part) if html_part is not None else None
+
+# Parsing IMAP messages with one reused parser instead of building one per message
+_BYTES_PARSER = BytesParser(policy=compat32)
+
 class EmailExtractor:
     """
     A robust parser to extract email contact information (email address, name, physical address, phone number)
@@ -17,6 +135,10 @@ class EmailExtractor:
 
     # Define email file extensions
     EMAIL_FILE_EXTENSIONS = ['.eml', '.mbox']
+    # Messages requested per IMAP UID FETCH
+    IMAP_FETCH_BATCH = 200
+    # Fewer local email files than this are scanned in-process; a worker pool costs more to start
+    PARALLEL_MIN_FILES = 8
 
     def __init__(self, host=None, username=None, password=None):
         self.host = host
@@ -32,8 +154,9 @@ class EmailExtractor:
             'profiles': []
         }
         self.processed_emails = set()  # Use a set for processed_emails
+        # Membership sets mirroring the contact_data lists, so dedup is O(1) per item
+        self._seen_contacts = {'emails': set(), 'phone_numbers': set(), 'addresses': set()}
 
-    @staticmethod
     def extract_contact_info(self, text, source):
         """
         Extracts contact information (email, name, address, phone) from the given text.
@@ -45,44 +168,46 @@ class EmailExtractor:
         Returns:
             dict: A dictionary containing the extracted contact information.
         """
-        # Extract email addresses
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,7}'
-        emails = re.findall(email_pattern, text)
-        
-        # Extract names (basic heuristic for names)
-        name_pattern = r'\b[A-Z][a-z]+\s[A-Z][a-z]+\b'  # Matches "First Last"
-        names = re.findall(name_pattern, text)
-        
-        # Extract physical addresses
-        address_pattern = r'\d{1,5}\s\w+(\s\w+)*,\s\w+,\s[A-Z]{2}\s\d{5}'  # Matches "123 Main St, City, ST 12345"
-        addresses = re.findall(address_pattern, text)
-        
-        # Extract phone numbers (use a robust, consistent pattern)
-        phone_pattern = r'(?:\+?\d{1,2}[\s.-]?)?(?:\(?\d{3}\)?[\s.-]?)?\d{3}[\s.-]?\d{4}'  # Matches international and US phone numbers
-        phones = re.findall(phone_pattern, text)
-        
+        return self._store_contacts(_scan_contacts(text), source)
+
+    def _store_contacts(self, found, source):
+        """
+        Builds a donor profile from scanned contact matches and merges it into contact_data.
+
+        Args:
+            found (dict): Matches keyed by kind, as returned by _scan_contacts.
+            source (str): The source of the contact information
+
+        Returns:
+            dict: The profile dictionary, or None if nothing was found.
+        """
+        emails = found['email']
+        names = found['name']
+        addresses = found['address']
+        phones = found['phone']
+
         # Only create profile if we have valid information
         if emails or names or addresses or phones:
             donor_profile = DonorProfile(name=names[0] if names else None, source_url=source)
+            now = datetime.now()
             for email in emails:
-                donor_profile.add_email(email, source='email')
+                donor_profile.add_email(email, source='email', now=now)
             for phone in phones:
-                donor_profile.add_phone(phone, source='email')
+                donor_profile.add_phone(phone, source='email', now=now)
             for address in addresses:
-                donor_profile.add_address(address, source='email')
+                donor_profile.add_address(address, source='email', now=now)
             profile_dict = donor_profile.to_dict()
             # Update our data structure
             self.contact_data['profiles'].append(profile_dict)
             # Update individual collections
-            for email in donor_profile.emails:
-                if email not in self.contact_data['emails']:
-                    self.contact_data['emails'].append(email)
-            for phone in donor_profile.phone_numbers:
-                if phone not in self.contact_data['phone_numbers']:
-                    self.contact_data['phone_numbers'].append(phone)
-            for address in donor_profile.addresses:
-                if address not in self.contact_data['addresses']:
-                    self.contact_data['addresses'].append(address)
+            for field, values in (('emails', donor_profile.emails),
+                                  ('phone_numbers', donor_profile.phone_numbers),
+                                  ('addresses', donor_profile.addresses)):
+                seen = self._seen_contacts[field]
+                for value in values:
+                    if value not in seen:
+                        seen.add(value)
+                        self.contact_data[field].append(value)
             return profile_dict
         return None
 
@@ -111,62 +236,68 @@ class EmailExtractor:
             if not self.mail:
                 raise ValueError("IMAP connection is not established. Call connect_to_email() first.")
             self.mail.select(folder)
-            _, data = self.mail.search(None, 'ALL')
-            for num in data[0].split():
-                _, data = self.mail.fetch(num, '(RFC822)')
-                raw_email = data[0][1]
-                email_message = email.message_from_bytes(raw_email)
-
-                # Extract email body
-                body = None
-                for part in email_message.walk():
-                    content_type = part.get_content_type()
-                    if content_type == "text/plain":
-                        body = part.get_payload(decode=True).decode()
-                        break
-                    elif content_type == "text/html" and body is None:
-                        body = part.get_payload(decode=True).decode()
-
-                if body:
-                    # Extract contact info and update our data structure
-                    profile = self.extract_contact_info(body, f"email_{num}")
-                    if profile:
-                        logging.info(f"Extracted contact info from email {num}")
-
-                if body:
-                    # Extract contact information from the email body
-                    contact_info = self.extract_contact_info(body)
-
-                    # Check if the email has already been processed
-                    email_id = contact_info['Email']
-                    if email_id and email_id not in self.processed_emails:
-                        self.processed_emails.add(email_id)
-                        self.contact_data.append(contact_info)
-            logging.info(f"Parsed {len(self.contact_data)} contacts from folder '{folder}'.")
+            _, data = self.mail.uid('SEARCH', None, 'ALL')
+            uids = [uid for uid in data[0].split() if f"imap:{folder}:{uid.decode()}" not in self.processed_emails]
+
+            # Fetch messages in batches of UIDs, one round-trip per batch; PEEK leaves \Seen untouched
+            for start in range(0, len(uids), self.IMAP_FETCH_BATCH):
+                batch = b','.join(uids[start:start + self.IMAP_FETCH_BATCH])
+                _, data = self.mail.uid('FETCH', batch, '(BODY.PEEK[])')
+                for index, item in enumerate(data):
+                    # Message literals come back as (envelope, bytes) tuples, each followed by
+                    # the rest of its response (b')' or b' UID 42)')
+                    if not isinstance(item, tuple):
+                        continue
+                    uid_match = _FETCH_UID_RE.search(item[0])
+                    if not uid_match and index + 1 < len(data) and isinstance(data[index + 1], bytes):
+                        uid_match = _FETCH_UID_RE.search(data[index + 1])
+                    if not uid_match:
+                        continue
+                    num = uid_match.group(1).decode()
+                    self.processed_emails.add(f"imap:{folder}:{num}")
+                    email_message = _BYTES_PARSER.parsebytes(item[1])
+
+                    body = _first_text(email_message)
+                    if body:
+                        # Extract contact info and update our data structure
+                        profile = self.extract_contact_info(body, f"email_{num}")
+                        if profile:
+                            logging.info(f"Extracted contact info from email {num}")
+            logging.info(f"Parsed {len(self.contact_data['profiles'])} contacts from folder '{folder}'.")
         except Exception as e:
             logging.error(f"Error parsing emails from folder '{folder}': {e}")
 
-    def parse_email_files(self, directory):
+    def parse_email_files(self, directory, max_workers=None):
         """
         Parses email files (e.g., .eml, .mbox) in a directory and extracts contact information.
 
         Args:
             directory (str): The directory containing email files.
+            max_workers (int): Processes to read and scan files with; None uses os.cpu_count()
+                and 1 scans them in this process. Small directories are always scanned in-process.
         """
         try:
-            for root, _, files in os.walk(directory):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    _, file_extension = os.path.splitext(file_path)
-                    if file_extension in self.EMAIL_FILE_EXTENSIONS:
-                        logging.info(f"Processing email file: {file_path}")
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            contact_info = self.extract_contact_info(content)
-                            email_id = contact_info['Email']
-                            if email_id and email_id not in self.processed_emails:
-                                self.processed_emails.add(email_id)
-                                self.contact_data.append(contact_info)
+            file_paths = [
+                file_path for file_path in _iter_files(directory, tuple(self.EMAIL_FILE_EXTENSIONS))
+                if file_path not in self.processed_emails
+            ]
+
+            # Reading and scanning is independent per file; profiles are merged here in walk order
+            if max_workers is None:
+                max_workers = os.cpu_count() or 1
+            if max_workers > 1 and len(file_paths) >= self.PARALLEL_MIN_FILES:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    results = list(executor.map(_scan_email_file, file_paths, chunksize=32))
+            else:
+                results = map(_scan_email_file, file_paths)
+
+            for file_path, messages in zip(file_paths, results):
+                if messages is None:
+                    continue
+                logging.info(f"Processing email file: {file_path}")
+                self.processed_emails.add(file_path)
+                for found in messages:
+                    self._store_contacts(found, file_path)
         except Exception as e:
             logging.error(f"Error parsing email files in directory '{directory}': {e}")
 
@@ -178,36 +309,30 @@ class EmailExtractor:
             url (str): The URL of the site being scraped.
         """
         try:
-            parsed_url = urlparse(url)
-            filename = f"{parsed_url.netloc.replace('.', '_')}_contacts.csv"
+            filename = _csv_filename(url)
 
             # Define the fieldnames for the CSV file
-            fieldnames = ['Email', 'Name', 'Address', 'Phone']
+            fieldnames = ('Email', 'Name', 'Address', 'Phone')
+
+            # Write each email/phone/address as a separate row if multiple exist (cartesian product)
+            rows = (
+                (email, profile.get('name', ''), address, phone)
+                for profile in self.contact_data['profiles']
+                for email, phone, address in product(
+                    profile.get('emails', []) or [''],
+                    profile.get('phone_numbers', []) or [''],
+                    profile.get('addresses', []) or ['']
+                )
+            )
 
-            # Write to CSV
-            if not os.path.exists(filename):
-                with open(filename, 'w', newline='') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
+            # Open once in append mode; a new or empty file gets the header first
             with open(filename, 'a', newline='') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                for profile in self.contact_data['profiles']:
-                    # Write each email/phone/address as a separate row if multiple exist
-                    emails = profile.get('emails', []) or ['']
-                    phones = profile.get('phone_numbers', []) or ['']
-                    addresses = profile.get('addresses', []) or ['']
-                    name = profile.get('name', '')
-                    # Write all combinations (cartesian product)
-                    for email in emails:
-                        for phone in phones:
-                            for address in addresses:
-                                writer.writerow({
-                                    'Email': email,
-                                    'Name': name,
-                                    'Address': address,
-                                    'Phone': phone
-                                })
+                writer = csv.writer(csvfile)
+                if csvfile.tell() == 0:
+                    writer.writerow(fieldnames)
+                writer.writerows(rows)
             self.contact_data = {'emails': [], 'phone_numbers': [], 'addresses': [], 'profiles': []}
+            self._seen_contacts = {'emails': set(), 'phone_numbers': set(), 'addresses': set()}
             logging.info(f"Saved contact information to CSV file: {filename}")
         except Exception as e:
             logging.error(f"Error saving contact information to CSV: {e}")
\ No newline at end of file
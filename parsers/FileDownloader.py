@@ -1,11 +1,27 @@
 import os
 import hashlib
 import logging
+import tempfile
+import orjson
 import requests
 from datetime import datetime
 from utils import make_request  # Ensure make_request is imported correctly
 from config import TOR_PROXY  # Import TOR_PROXY from config.py
-import re
+import string
+
+_SAFE_NAME_CHARS = frozenset(string.ascii_letters + string.digits + '._-')
+
+class _SafeNameTable(dict):
+    """
+    str.translate table that replaces every character r'[^a-zA-Z0-9._-]' would match with '_'.
+    Entries are filled in on first use, so only characters actually seen are stored.
+    """
+    def __missing__(self, codepoint):
+        value = codepoint if chr(codepoint) in _SAFE_NAME_CHARS else '_'
+        self[codepoint] = value
+        return value
+
+_SAFE_NAME_TABLE = _SafeNameTable()
 
 class FileDownloader:
     """
@@ -13,8 +29,18 @@ class FileDownloader:
     Includes duplicate detection using SHA-256 hashes and supports Tor proxy for anonymity.
     """
 
-    @staticmethod
-    def download_file(file_url, directory, allowed_extensions=None):
+    # Sidecar in each download directory: file name -> [size, mtime_ns, sha256]
+    HASH_INDEX_FILE = '.file_hashes.json'
+    # Prefix of in-progress downloads, which are left out of the index
+    PARTIAL_PREFIX = '.download_'
+
+    def __init__(self):
+        # Per directory: the sidecar records, and raw sha256 digest -> file name for O(1)
+        # duplicate checks. 32-byte digests as keys take half the memory of hex strings.
+        self._records = {}
+        self._hash_index = {}
+
+    def download_file(self, file_url, directory, allowed_extensions=None):
         """
         Downloads a file from the given URL and saves it to the specified directory.
 
@@ -35,40 +61,48 @@ class FileDownloader:
                 logging.info(f"Skipping file with unsupported extension: {file_ext}")
                 return None
 
-            # Make the request using Tor proxy
-            response = make_request(file_url, headers={}, proxies=TOR_PROXY, max_retries=5, backoff_factor=1)
+            # Make the request using Tor proxy; the body is streamed rather than buffered in memory
+            response = make_request(file_url, headers={}, proxies=TOR_PROXY, max_retries=5, backoff_factor=1, stream=True)
             if response is None:
-                response = make_request(file_url, headers={}, proxies=None, max_retries=5, backoff_factor=1)
+                response = make_request(file_url, headers={}, proxies=None, max_retries=5, backoff_factor=1, stream=True)
             if response is None:
                 logging.error(f"Failed to fetch file from {file_url}")
                 return None
 
-            response.raise_for_status()
-            content = response.content
-            new_file_hash = hashlib.sha256(content).hexdigest()
-
             # Ensure the directory exists
             os.makedirs(directory, exist_ok=True)
+            hash_index = self._index_for(directory)
+
+            # Hash the body while writing it to a temporary file next to its final location
+            hash_obj = hashlib.sha256()
+            with response:
+                response.raise_for_status()
+                with tempfile.NamedTemporaryFile('wb', dir=directory, prefix=self.PARTIAL_PREFIX, delete=False) as tmp:
+                    try:
+                        for chunk in response.iter_content(chunk_size=65536):
+                            hash_obj.update(chunk)
+                            tmp.write(chunk)
+                    except BaseException:
+                        tmp.close()
+                        os.unlink(tmp.name)
+                        raise
+            new_file_digest = hash_obj.digest()
 
             # Check for duplicate files in the directory
-            for existing_file in os.listdir(directory):
-                full_path = os.path.join(directory, existing_file)
-                if not os.path.isfile(full_path):
-                    continue
-                existing_hash = FileDownloader.calculate_file_hash(full_path)
-                if existing_hash == new_file_hash:
-                    logging.info(f"Duplicate file found for {file_url}, skipping download.")
-                    return None
+            if new_file_digest in hash_index:
+                os.unlink(tmp.name)
+                logging.info(f"Duplicate file found for {file_url}, skipping download.")
+                return None
 
             # Generate a unique file name
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            sanitized_name = re.sub(r'[^a-zA-Z0-9._-]', '_', os.path.basename(file_url))
+            sanitized_name = os.path.basename(file_url).translate(_SAFE_NAME_TABLE)
             file_name = f"{timestamp}_{sanitized_name}"
             file_path = os.path.join(directory, file_name)
 
             # Save the file
-            with open(file_path, 'wb') as file:
-                file.write(content)
+            os.replace(tmp.name, file_path)
+            self._record_file(directory, file_name, new_file_digest)
 
             logging.info(f"File downloaded and saved to: {file_path}")
             return file_path
@@ -83,6 +117,77 @@ class FileDownloader:
             logging.error(f"Unexpected error while downloading file from {file_url}: {e}", exc_info=True)
             return None
 
+    def _index_for(self, directory):
+        """
+        Returns the sha256 -> file name index for a directory, building it on first use.
+
+        Files whose size and mtime match the sidecar keep their stored hash; only new or
+        changed files are read and hashed.
+
+        Args:
+            directory (str): The download directory.
+
+        Returns:
+            dict: Maps each file's raw SHA-256 digest to its name.
+        """
+        hash_index = self._hash_index.get(directory)
+        if hash_index is not None:
+            return hash_index
+
+        try:
+            with open(os.path.join(directory, self.HASH_INDEX_FILE), 'rb') as f:
+                cached = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            cached = {}
+
+        records = {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name == self.HASH_INDEX_FILE or entry.name.startswith(self.PARTIAL_PREFIX) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                record = cached.get(entry.name)
+                if not (record and record[0] == stat.st_size and record[1] == stat.st_mtime_ns):
+                    file_hash = self.calculate_file_hash(entry.path)
+                    if file_hash is None:
+                        continue
+                    record = [stat.st_size, stat.st_mtime_ns, file_hash]
+                records[entry.name] = record
+
+        self._records[directory] = records
+        hash_index = self._hash_index[directory] = {bytes.fromhex(record[2]): name for name, record in records.items()}
+        if records != cached:
+            self._save_index(directory)
+        return hash_index
+
+    def _record_file(self, directory, file_name, file_digest):
+        """
+        Adds a newly saved file to the directory's index and writes the sidecar back.
+
+        Args:
+            directory (str): The download directory.
+            file_name (str): The name of the saved file.
+            file_digest (bytes): The raw SHA-256 digest of its contents.
+        """
+        stat = os.stat(os.path.join(directory, file_name))
+        self._records[directory][file_name] = [stat.st_size, stat.st_mtime_ns, file_digest.hex()]
+        self._hash_index[directory][file_digest] = file_name
+        self._save_index(directory)
+
+    def _save_index(self, directory):
+        """
+        Writes the directory's hash records to its sidecar file.
+
+        Args:
+            directory (str): The download directory.
+        """
+        try:
+            with open(os.path.join(directory, self.HASH_INDEX_FILE), 'wb') as f:
+                f.write(orjson.dumps(self._records[directory]))
+        except OSError as e:
+            # The index is only a cache; the next instance rebuilds whatever is missing
+            logging.warning(f"Could not write hash index for {directory}: {e}")
+
     @staticmethod
     def calculate_file_hash(file_path):
         """
@@ -95,11 +200,16 @@ class FileDownloader:
             str: The SHA-256 hash of the file.
         """
         try:
-            hash_obj = hashlib.sha256()
             with open(file_path, 'rb') as f:
-                while chunk := f.read(8192):
-                    hash_obj.update(chunk)
-            return hash_obj.hexdigest()
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: the file is fed straight into OpenSSL's hasher
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                hash_obj = hashlib.sha256()
+                buffer = bytearray(1 << 20)
+                view = memoryview(buffer)
+                while size := f.readinto(buffer):
+                    hash_obj.update(view[:size])
+                return hash_obj.hexdigest()
         except Exception as e:
             logging.error(f"Error calculating hash for file {file_path}: {e}")
             return None
@@ -31,38 +31,34 @@ class GoogleExtractor:
                 personFields='names,emailAddresses,phoneNumbers,addresses'
             ).execute()
 
+            # One timestamp for the whole fetch rather than one per contact
+            fetched_at = datetime.now().isoformat()
             while results:
                 connections = results.get('connections', [])
                 for person in connections:
+                    # Look each field up once and reuse it for the profile and the collections
+                    names = person.get('names') or ()
+                    emails = [email.get('value', '') for email in person.get('emailAddresses') or ()]
+                    phones = [phone.get('value', '') for phone in person.get('phoneNumbers') or ()]
+                    addresses = [address.get('formattedValue', '') for address in person.get('addresses') or ()]
                     # Create profile using DataManager's structure
                     profile = {
-                        'name': person['names'][0].get('displayName', '') if 'names' in person else '',
-                        'email': person.get('emailAddresses', [{}])[0].get('value', '') if person.get('emailAddresses') else '',
-                        'phone': person.get('phoneNumbers', [{}])[0].get('value', '') if person.get('phoneNumbers') else '',
-                        'address': person.get('addresses', [{}])[0].get('formattedValue', '') if person.get('addresses') else '',
+                        'name': names[0].get('displayName', '') if names else '',
+                        'email': emails[0] if emails else '',
+                        'phone': phones[0] if phones else '',
+                        'address': addresses[0] if addresses else '',
                         'source': 'gmail',
-                        'fetched_at': datetime.now().isoformat()
+                        'fetched_at': fetched_at
                     }
                     profiles.append(profile)
                     # Update data structure using DataManager's structure
                     self.data_manager.add_donor_profile(profile)
                     self.data_manager.update_data({
-                        'Emails': [email.get('value', '') for email in person.get('emailAddresses', [])],
-                        'PhoneNumbers': [phone.get('value', '') for phone in person.get('phoneNumbers', [])],
-                        'Addresses': [address.get('formattedValue', '') for address in person.get('addresses', [])],
+                        'Emails': emails,
+                        'PhoneNumbers': phones,
+                        'Addresses': addresses,
                         'Profiles': [profile]
                     })
-                    
-                    # Update individual collections
-                    for email in profile['emails']:
-                        if email not in self.contacts['emails']:
-                            self.contacts['emails'].append(email)
-                    for phone in profile['phone_numbers']:
-                        if phone not in self.contacts['phone_numbers']:
-                            self.contacts['phone_numbers'].append(phone)
-                    for address in profile['addresses']:
-                        if address not in self.contacts['addresses']:
-                            self.contacts['addresses'].append(address)
 
                 # Check for nextPageToken to fetch additional contacts
                 next_page_token = results.get('nextPageToken')
@@ -1,11 +1,88 @@
+import functools
 import logging
 import re
-from bs4 import BeautifulSoup
+import string
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree, html as lxml_html
 from datetime import datetime
 from urllib.parse import urljoin
 from utils import save_html_content, fetch_html
 from config import TOR_PROXY, key_data_patterns
 
+try:
+    # google-re2 matches in linear time, which keeps scans of long scraped text bounded
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# Patterns used on every page and every block, compiled once at import
+_EMAIL_PATTERN = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
+_PHONE_PATTERN = r'(?:\+?\d{1,2}[\s\xa0.-]?)?(?:\(?\d{3}\)?[\s\xa0.-]?)?\d{3}[\s\xa0.-]?\d{4}'
+_NAME_PATTERN = r'[A-Z][a-z]+(?: [A-Z][a-z]+)*|[A-Z]{2,}(?: [A-Z]{2,})*'
+_NAME_RE = _regex.compile(_NAME_PATTERN)
+# Fused scanner: one pass over the text, with match.lastgroup telling the kinds apart.
+# Earlier alternatives win at the same position, so digits inside an email are not read as a phone.
+# Names are not fused in: a capitalised word would claim the local part of an email after it.
+_CONTACT_RE = _regex.compile(f'(?P<email>{_EMAIL_PATTERN})|(?P<phone>{_PHONE_PATTERN})')
+_NONDIGIT_RE = re.compile(r'\D')
+_YEAR_RE = re.compile(r'\d{4}')
+_PRICE_RE = re.compile(r'\$?\d+[\.,]?\d*')
+
+# Elements scanned as candidate contact blocks
+_BLOCK_TAGS = frozenset(['tr', 'li', 'div', 'section'])
+# Headings and bold labels that can name the blocks after them
+_LABEL_TAGS = frozenset(['h1', 'h2', 'h3', 'h4', 'b', 'strong'])
+# Elements whose contents are not page text (bs4 leaves the same ones out of get_text)
+_NON_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+
+# Deletes every character a name may contain; anything left over rules the string out
+_NAME_CHARS_TABLE = str.maketrans('', '', string.ascii_letters + string.whitespace + "\xa0-'")
+
+# Single words that look like names on donor pages but are navigation or role labels
+_NON_NAME_WORDS = frozenset([
+    'contact', 'email', 'phone', 'info', 'support', 'home', 'about', 'learn', 'events', 'application',
+    'portal', 'president', 'vice', 'director', 'manager', 'grantmaking', 'carolina', 'theatre',
+    'community', 'grant', 'donor', 'profile', 'team', 'staff', 'fund', 'advisor', 'services',
+    'resources', 'scholarships', 'mutual', 'shares', 'investment', 'management', 'reporting',
+    'general', 'inquiries', 'media', 'requests', 'volunteer'
+])
+
+def _dedup(seq):
+    """
+    Returns the items of seq without duplicates, keeping first-seen order.
+    """
+    return list(dict.fromkeys(seq))
+
+def _parse_document(html):
+    """
+    Parses HTML with lxml and empties the elements that hold no page text.
+
+    Returns:
+        lxml.html.HtmlElement: The document root, or None if the document is empty.
+    """
+    try:
+        try:
+            root = lxml_html.document_fromstring(html)
+        except ValueError:
+            # lxml refuses str input that carries an XML encoding declaration
+            root = lxml_html.document_fromstring(html.encode('utf-8'))
+    except etree.ParserError:
+        return None
+    for element in list(root.iter(*_NON_TEXT_TAGS)):
+        # Tails stay in place, so text around these elements is kept as separate pieces
+        element.text = None
+        del element[:]
+    return root
+
+def _stripped_strings(element):
+    """
+    Yields the non-empty, stripped text pieces inside element, like bs4's stripped_strings.
+    """
+    for text in element.itertext():
+        text = text.strip()
+        if text:
+            yield text
+
 class HTMLParser:
     @staticmethod
     def parse_html(url, processed_urls):
@@ -23,7 +100,7 @@ class HTMLParser:
             logging.info(f"Skipping already processed URL: {url}")
             return None
 
-        html_content = fetch_html(url, proxy=TOR_PROXY)  # Use TOR_PROXY if needed
+        html_content = fetch_html(url)  # Tries TOR_PROXY first, then a direct connection
         if html_content is None:
             logging.error(f"Failed to fetch HTML for {url}")
             return None
@@ -32,6 +109,42 @@ class HTMLParser:
         return html_content
 
     @staticmethod
+    def parse_html_batch(urls, processed_urls, max_concurrency=5):
+        """
+        Fetches the HTML content of several URLs concurrently, avoiding duplicates.
+
+        Args:
+            urls (iterable): The URLs to parse.
+            processed_urls (set): A set of already processed URLs; fetched URLs are added to it.
+            max_concurrency (int): Upper bound on the number of fetches running at once.
+
+        Returns:
+            dict: The raw HTML content of each URL that was fetched, keyed by URL, in input order.
+        """
+        pending = []
+        for url in dict.fromkeys(urls):
+            if url in processed_urls:
+                logging.info(f"Skipping already processed URL: {url}")
+            else:
+                pending.append(url)
+        if not pending:
+            return {}
+
+        # Fetches wait on the network, so threads overlap them; processed_urls is only touched here
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(pending))) as executor:
+            pages = list(executor.map(fetch_html, pending))
+
+        results = {}
+        for url, html_content in zip(pending, pages):
+            if html_content is None:
+                logging.error(f"Failed to fetch HTML for {url}")
+                continue
+            processed_urls.add(url)
+            results[url] = html_content
+        return results
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _is_plausible_donor_name(name):
         """
         Heuristic to determine if a string is a plausible donor name.
@@ -50,7 +163,44 @@ class HTMLParser:
         if name.isupper() or name.islower():
             return False
         # No numbers or special chars (except hyphen, apostrophe)
-        if re.search(r'[^a-zA-Z\s\-\']', name):
+        if name.translate(_NAME_CHARS_TABLE):
+            return False
+        return True
+
+    @staticmethod
+    def _is_valid_phone(phone):
+        """
+        Require at least 10 digits, not a year, not a price.
+        """
+        digits = _NONDIGIT_RE.sub('', phone)
+        if len(digits) < 10:
+            return False
+        if _YEAR_RE.fullmatch(phone):
+            return False
+        if _PRICE_RE.match(phone):
+            return False
+        return True
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _is_plausible_name(name):
+        """
+        Looser name check for contact blocks: single capitalized words are allowed unless
+        they are common labels; no all upper/lower case, numbers or special characters
+        (except hyphen, apostrophe).
+        """
+        if not name or len(name) < 2:
+            return False
+        # Allow single-word names if they are capitalized and not a common word
+        if len(name.split()) == 1:
+            if not name[0].isupper():
+                return False
+            if name.lower() in _NON_NAME_WORDS:
+                return False
+        # Not all upper/lower, no numbers/special chars (except hyphen, apostrophe)
+        if name.isupper() or name.islower():
+            return False
+        if name.translate(_NAME_CHARS_TABLE):
             return False
         return True
 
@@ -63,7 +213,7 @@ class HTMLParser:
             dict: A dictionary containing extracted data with proper data structures
         """
         logging.info(f"Starting HTML parsing for URL: {url}")
-        soup = BeautifulSoup(html, 'html.parser')
+        root = _parse_document(html)
 
         # Initialize data structures with lists for consistency
         data = {
@@ -87,77 +237,79 @@ class HTMLParser:
         names = []
         donor_profiles = []
 
+        if root is None:
+            logging.info(f"Empty HTML document for URL: {url}")
+            return data
+
         # Extract all visible text
-        data['RawText'] = soup.get_text(' ', strip=True)
+        data['RawText'] = ' '.join(_stripped_strings(root))
 
         # --- BASIC EMAIL AND PHONE EXTRACTION (general, not format-specific) ---
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        phone_pattern = r'(?:\+?\d{1,2}[\s.-]?)?(?:\(?\d{3}\)?[\s.-]?)?\d{3}[\s.-]?\d{4}'
-        emails_from_text = re.findall(email_pattern, data['RawText'])
-        phones_from_text = re.findall(phone_pattern, data['RawText'])
-        data['Emails'].extend([e for e in emails_from_text if e not in data['Emails']])
-        data['PhoneNumbers'].extend([p for p in phones_from_text if p not in data['PhoneNumbers']])
+        found = {'email': [], 'phone': []}
+        for match in _CONTACT_RE.finditer(data['RawText']):
+            found[match.lastgroup].append(match.group())
+        data['Emails'] = _dedup(found['email'])
+        data['PhoneNumbers'] = _dedup(found['phone'])
 
         # --- DYNAMIC DONOR PROFILE EXTRACTION (robust, positive-signal only) ---
-        def is_valid_email(email):
-            # Accept any valid email
-            return bool(email)
-        def is_valid_phone(phone):
-            digits = re.sub(r'\D', '', phone)
-            # Require at least 10 digits, not a year, not a price
-            if len(digits) < 10:
-                return False
-            if re.fullmatch(r'\d{4}', phone):
-                return False
-            if re.match(r'\$?\d+[\.,]?\d*', phone):
-                return False
-            return True
-        def is_plausible_name(name):
-            # At least two words, not all upper/lower, no numbers/special chars (except hyphen, apostrophe)
-            if not name or len(name) < 2:
-                return False
-            # Allow single-word names if they are capitalized and not a common word
-            if len(name.split()) == 1:
-                if not name[0].isupper():
-                    return False
-                if name.lower() in ['contact', 'email', 'phone', 'info', 'support', 'home', 'about', 'learn', 'events', 'application', 'portal', 'president', 'vice', 'director', 'manager', 'grantmaking', 'carolina', 'theatre', 'community', 'grant', 'donor', 'profile', 'team', 'staff', 'fund', 'advisor', 'services', 'resources', 'grant', 'scholarships', 'mutual', 'fund', 'shares', 'investment', 'management', 'reporting', 'general', 'inquiries', 'media', 'requests', 'volunteer']:
-                    return False
-            # Not all upper/lower, no numbers/special chars (except hyphen, apostrophe)
-            if name.isupper() or name.islower():
-                return False
-            if re.search(r'[^a-zA-Z\s\-\']', name):
-                return False
-            return True
+        # Bound once per page rather than looked up on every block
+        is_valid_phone = HTMLParser._is_valid_phone
+        is_plausible_name = HTMLParser._is_plausible_name
         seen_profiles = set()
-        for block in soup.find_all(['tr', 'li', 'div', 'section']):
-            block_text = block.get_text(separator=' ', strip=True)
-            if len(block_text) < 15 or len(block_text) > 400:
+        # The last label opened before the current element in document order (ancestors included),
+        # and the name found in each label, so a label shared by many blocks is read once
+        label = None
+        label_names = {}
+        for element in root.iter():
+            tag = element.tag
+            if tag in _LABEL_TAGS:
+                label = element
+                continue
+            if tag not in _BLOCK_TAGS:
+                continue
+            # The block's text joined by spaces, but stop collecting once the block is too long
+            strings = []
+            length = -1
+            for text in _stripped_strings(element):
+                length += len(text) + 1
+                if length > 400:
+                    break
+                strings.append(text)
+            if length < 15 or length > 400:
                 continue
-            email_match = re.search(email_pattern, block_text)
-            phone_match = re.search(phone_pattern, block_text)
+            block_text = ' '.join(strings)
+            # First email and phone in the block, from a single scan; the name is looked for
+            # only in the text outside those matches
+            first = {}
+            outside = []
+            last = 0
+            for match in _CONTACT_RE.finditer(block_text):
+                first.setdefault(match.lastgroup, match.group())
+                outside.append(block_text[last:match.start()])
+                last = match.end()
+            outside.append(block_text[last:])
             # Improved name extraction: allow single word, all caps, and fallback to nearby text
-            name_match = re.search(r'([A-Z][a-z]+(?: [A-Z][a-z]+)*|[A-Z]{2,}(?: [A-Z]{2,})*)', block_text)
+            name_match = _NAME_RE.search('\x00'.join(outside))
             name = name_match.group().strip() if name_match else ''
             # Fallback: if no name, try previous sibling or heading
-            if not name:
-                prev = block.find_previous(['h1', 'h2', 'h3', 'h4', 'b', 'strong'])
-                if prev:
-                    prev_text = prev.get_text(separator=' ', strip=True)
-                    prev_name_match = re.search(r'([A-Z][a-z]+(?: [A-Z][a-z]+)*|[A-Z]{2,}(?: [A-Z]{2,})*)', prev_text)
-                    name = prev_name_match.group().strip() if prev_name_match else ''
-            email = email_match.group() if email_match else None
-            phone = phone_match.group() if phone_match else None
-            if not ((email and is_valid_email(email)) or (phone and is_valid_phone(phone))):
+            if not name and label is not None:
+                name = label_names.get(label)
+                if name is None:
+                    prev_name_match = _NAME_RE.search(' '.join(_stripped_strings(label)))
+                    name = label_names[label] = prev_name_match.group().strip() if prev_name_match else ''
+            email = first.get('email')
+            phone = first.get('phone')
+            if not (email or (phone and is_valid_phone(phone))):
                 continue
             if not is_plausible_name(name):
                 # Fallback: use first 2-3 words before email/phone as name if they look like a name
                 if email:
-                    before_email = block_text.split(email)[0].strip()
+                    before_email = block_text.partition(email)[0].strip()
                     possible_name = ' '.join(before_email.split()[-3:])
                     if is_plausible_name(possible_name):
                         name = possible_name
                 elif phone:
-                    before_phone = block_text.split(phone)[0].strip()
+                    before_phone = block_text.partition(phone)[0].strip()
                     possible_name = ' '.join(before_phone.split()[-3:])
                     if is_plausible_name(possible_name):
                         name = possible_name
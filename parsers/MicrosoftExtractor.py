@@ -64,13 +64,9 @@ class MicrosoftExtractor:
                 # Update data structure
                 self.contacts['profiles'].append(profile)
                 
-                # Update individual collections
-                for email in profile['emails']:
-                    if email not in self.contacts['emails']:
-                        self.contacts['emails'].append(email)
-                for phone in profile['phone_numbers']:
-                    if phone not in self.contacts['phone_numbers']:
-                        self.contacts['phone_numbers'].append(phone)
+                # Update individual collections (deduplicated below)
+                self.contacts['emails'].extend(profile['emails'])
+                self.contacts['phone_numbers'].extend(profile['phone_numbers'])
 
             # Deduplicate emails, phone_numbers, and profiles
             self.contacts['emails'] = list(dict.fromkeys(self.contacts['emails']))
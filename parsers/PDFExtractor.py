@@ -1,5 +1,4 @@
 import logging
-import re
 import fitz  # PyMuPDF
 import os
 import hashlib
@@ -57,7 +56,7 @@ class PDFExtractor:
 
             # Extract contact information
             for pattern_name, pattern in key_data_patterns.items():
-                matches = re.findall(pattern, text)
+                matches = pattern.findall(text)
                 if matches:
                     if pattern_name == 'email':
                         contact_data['emails'].extend(matches)
@@ -74,12 +73,13 @@ class PDFExtractor:
             # Create profile using DonorProfile if we have any contact information
             if contact_data['emails'] or contact_data['phone_numbers'] or contact_data['addresses']:
                 donor_profile = DonorProfile(name=None, source_url=pdf_url)
+                now = datetime.now()
                 for email in contact_data['emails']:
-                    donor_profile.add_email(email, source='pdf')
+                    donor_profile.add_email(email, source='pdf', now=now)
                 for phone in contact_data['phone_numbers']:
-                    donor_profile.add_phone(phone, source='pdf')
+                    donor_profile.add_phone(phone, source='pdf', now=now)
                 for address in contact_data['addresses']:
-                    donor_profile.add_address(address, source='pdf')
+                    donor_profile.add_address(address, source='pdf', now=now)
                 profile_dict = donor_profile.to_dict()
                 contact_data['profiles'].append(profile_dict)
 
@@ -135,7 +135,7 @@ class PDFExtractor:
         logging.debug(f"Checking for key data in text: {text[:500]}")  # Log first 500 characters
         for key, pattern in key_data_patterns.items():
             logging.debug(f"Checking pattern for {key}: {pattern}")
-            if re.search(pattern, text):
+            if pattern.search(text):
                 logging.info(f"Found key data ({key}) in PDF.")
                 return True
         logging.info("No key data found in PDF.")
@@ -1,11 +1,30 @@
+import functools
 import logging
 import re
+from urllib.parse import urlparse, urljoin
 from bs4 import BeautifulSoup
 from utils import fetch_html, save_html_content, run_puppeteer_script, get_sanitized_url_directory
 from parsers.DataManager import DataManager  # Import directly from the file
 from parsers.CSVExporter import CSVExporter  # Import directly from the file
 from parsers.HTMLParser import HTMLParser  # Import directly from the file
 
+# URL shape accepted by is_valid_url, compiled once at import
+_URL_RE = re.compile(
+    r'^(https?://)?'  # http:// or https://
+    r'([a-zA-Z0-9.-]+)'  # domain name
+    r'(\.[a-zA-Z]{2,})'  # top-level domain
+    r'(:\d+)?'  # optional port
+    r'(\/.*)?$'  # optional path
+)
+
+# Navigation menus repeat the same relative links on every page of a crawl
+@functools.lru_cache(maxsize=4096)
+def _join_url(base, href):
+    return urljoin(base, href)
+
+@functools.lru_cache(maxsize=4096)
+def _netloc(url):
+    return urlparse(url).netloc
 
 
 class Parser:
@@ -24,14 +43,7 @@ class Parser:
         Returns:
             bool: True if the URL is valid, False otherwise.
         """
-        url_pattern = re.compile(
-            r'^(https?://)?'  # http:// or https://
-            r'([a-zA-Z0-9.-]+)'  # domain name
-            r'(\.[a-zA-Z]{2,})'  # top-level domain
-            r'(:\d+)?'  # optional port
-            r'(\/.*)?$'  # optional path
-        )
-        return re.match(url_pattern, url) is not None
+        return _URL_RE.match(url) is not None
 
     def fetch_sitemap(self, url):
         """
@@ -102,13 +114,14 @@ class Parser:
         """
         if keywords is None:
             keywords = []
+        # All keywords in one case-insensitive alternation, so each link is scanned once
+        keyword_re = re.compile('|'.join(map(re.escape, keywords)), re.IGNORECASE) if keywords else None
         visited = set()
         all_profiles = []
-        from urllib.parse import urlparse, urljoin
-        domain = urlparse(start_url).netloc
+        domain = _netloc(start_url)
 
         def is_same_domain(url):
-            return urlparse(url).netloc == domain
+            return _netloc(url) == domain
 
         def crawl(url, depth):
             if depth > max_depth or url in visited:
@@ -126,19 +139,21 @@ class Parser:
                 self.data_manager.update_data(html_data)
                 # Optionally, create DonorProfile and add to all_profiles
                 from parsers.DonorProfile import DonorProfile
+                from datetime import datetime
                 profile = DonorProfile(name=None, source_url=url)
+                now = datetime.now()
                 for email in html_data.get('emails', []):
-                    profile.add_email(email, source='html')
+                    profile.add_email(email, source='html', now=now)
                 for phone in html_data.get('phones', []):
-                    profile.add_phone(phone, source='html')
+                    profile.add_phone(phone, source='html', now=now)
                 for address in html_data.get('addresses', []):
-                    profile.add_address(address, source='html')
+                    profile.add_address(address, source='html', now=now)
                 all_profiles.append(profile.to_dict())
             # Find and process PDF links
-            for link in BeautifulSoup(html, 'html.parser').find_all('a', href=True):
+            for link in BeautifulSoup(html, 'lxml').find_all('a', href=True):
                 next_url = link['href']
                 if not next_url.startswith('http'):
-                    next_url = urljoin(url, next_url)
+                    next_url = _join_url(url, next_url)
                 if next_url.lower().endswith('.pdf') and is_same_domain(next_url):
                     from parsers.PDFExtractor import PDFExtractor
                     from config import key_data_patterns
@@ -152,7 +167,7 @@ class Parser:
                 # Continue crawling HTML links
                 elif is_same_domain(next_url):
                     # Filter by keywords if provided
-                    if keywords and not any(kw.lower() in next_url.lower() for kw in keywords):
+                    if keyword_re and not keyword_re.search(next_url):
                         continue
                     if next_url not in visited:
                         crawl(next_url, depth + 1)
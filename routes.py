@@ -24,6 +24,8 @@ def setup_routes(app):
             
             if use_selenium:
                 success = authenticator.authenticate_with_selenium(login_url, username, password)
+                # Cookies are already saved; release the browser for the next login
+                authenticator.cleanup()
             else:
                 success = authenticator.authenticate_with_requests(login_url, username, password)
             
@@ -31,6 +31,9 @@ logging.basicConfig(
 EMAIL_FILE_EXTENSIONS = ['.eml', '.mbox']
 PDF_FILE_EXTENSION = '.pdf'
 
+# Sitemap URLs worth parsing contain one of these words (any case)
+RELEVANT_URL_RE = re.compile('donate|contact|about|contribute|fund', re.IGNORECASE)
+
 session = HTMLSession()
 
 def sanitize_url(url):
@@ -66,7 +69,14 @@ def run_puppeteer_script(url):
             # Merge new data with existing data
             for key, values in puppeteer_output.items():
                 if key in existing_data:
-                    existing_data[key] = list(set(existing_data[key] + values))
+                    # Append only unseen items, keeping order; dict items are compared by their JSON form
+                    merged = existing_data[key]
+                    seen = {json.dumps(item, sort_keys=True) for item in merged}
+                    for item in values:
+                        item_key = json.dumps(item, sort_keys=True)
+                        if item_key not in seen:
+                            seen.add(item_key)
+                            merged.append(item)
                 else:
                     existing_data[key] = values
 
@@ -146,8 +156,7 @@ class Parser:
             urls = [loc.text for loc in soup.find_all('loc')]
 
             # Filter URLs for relevance
-            relevant_keywords = ['donate', 'contact', 'about', 'contribute', 'fund']
-            filtered_urls = [url for url in urls if any(keyword in url.lower() for keyword in relevant_keywords)]
+            filtered_urls = [url for url in urls if RELEVANT_URL_RE.search(url)]
             logging.info(f"Filtered URLs: {filtered_urls}")
             return filtered_urls
         except Exception as e:
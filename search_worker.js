@@ -0,0 +1,35 @@
+const readline = require('readline');
+const { extractData, launchBrowser } = require('./search_puppeteer');
+
+// Long-running worker: one browser for the life of the process.
+// Reads one JSON request per line on stdin ({"url": ...}) and answers with
+// one JSON line on stdout ({"ok": true, "dataPath": ...} or {"ok": false, "error": ...}).
+(async () => {
+    const browser = await launchBrowser();
+    const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+    for await (const line of rl) {
+        if (!line.trim()) {
+            continue;
+        }
+        let reply;
+        let page = null;
+        try {
+            const { url } = JSON.parse(line);
+            page = await browser.newPage();
+            const { dataPath } = await extractData(page, url);
+            reply = { ok: true, dataPath };
+        } catch (error) {
+            console.error('Error processing request:', error.message);
+            reply = { ok: false, error: error.message };
+        } finally {
+            if (page) {
+                await page.close().catch(() => {});
+            }
+        }
+        process.stdout.write(JSON.stringify(reply) + '\n');
+    }
+
+    await browser.close();
+    console.error('Browser closed.');
+})();
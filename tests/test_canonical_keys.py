@@ -0,0 +1,25 @@
+from parsers.DataManager import DataManager
+from parsers.DonorProfile import DonorProfile
+
+
+def test_add_email_dedups_on_canonical_form():
+    profile = DonorProfile('Bob Smith')
+    profile.add_email('Bob@Example.com')
+    profile.add_email(' bob@example.com')
+    assert profile.emails == ['bob@example.com']
+    assert profile.raw_emails == ['Bob@Example.com', ' bob@example.com']
+
+
+def test_add_phone_dedups_on_digits():
+    profile = DonorProfile('Bob Smith')
+    profile.add_phone('(415) 555-1212')
+    profile.add_phone('415-555-1212')
+    assert profile.phone_numbers == ['(415) 555-1212']
+    assert profile.raw_phone_numbers == ['(415) 555-1212', '415-555-1212']
+
+
+def test_update_data_skips_name_case_variants():
+    manager = DataManager()
+    manager.update_data({'Profiles': [{'name': 'Jane', 'emails': ['jane@example.org']}]})
+    manager.update_data({'Profiles': [{'name': 'jane ', 'emails': ['other@example.org']}]})
+    assert manager.card_dict['Profiles'] == [{'name': 'Jane', 'emails': ['jane@example.org']}]
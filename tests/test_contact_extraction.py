@@ -0,0 +1,24 @@
+from parsers.EmailExtractor import _scan_contacts
+from parsers.HTMLParser import HTMLParser
+
+
+def test_scan_contacts_keeps_email_after_capitalised_word():
+    found = _scan_contacts("Email Jane.Doe@example.org")
+    assert found['email'] == ['Jane.Doe@example.org']
+    assert found['name'] == []
+
+
+def test_scan_contacts_name_before_email():
+    found = _scan_contacts("Mary Smith Mary.Smith@foo.org 555-123-4567")
+    assert found['name'] == ['Mary Smith']
+    assert found['email'] == ['Mary.Smith@foo.org']
+    assert found['phone'] == ['555-123-4567']
+
+
+def test_block_contact_keeps_full_email():
+    html = "<div>Mary Smith Mary.Smith@foo.org 555-123-4567</div>"
+    data = HTMLParser.extract_data_from_html(html, 'https://example.org/donors')
+    assert 'Mary.Smith@foo.org' in data['Emails']
+    profiles = data['Profiles']
+    assert [p['name'] for p in profiles] == ['Mary Smith']
+    assert profiles[0]['emails'] == ['Mary.Smith@foo.org']
@@ -1,6 +1,6 @@
 import os
 import logging
-import json
+import orjson
 import time
 import subprocess
 from datetime import datetime
@@ -64,7 +64,7 @@ def save_html_content(html, url):
     return file_path
 
 
-def make_request(url, headers=None, proxies=None, max_retries=3, backoff_factor=1):
+def make_request(url, headers=None, proxies=None, max_retries=3, backoff_factor=1, stream=False):
     """
     Makes an HTTP request with retries and exponential backoff.
 
@@ -74,6 +74,7 @@ def make_request(url, headers=None, proxies=None, max_retries=3, backoff_factor=
         proxies (dict): Optional proxies for the request.
         max_retries (int): Maximum number of retries.
         backoff_factor (int): Backoff factor for retries.
+        stream (bool): Defer downloading the body so the caller can read it with iter_content.
 
     Returns:
         requests.Response: The HTTP response object, or None if the request fails.
@@ -82,7 +83,7 @@ def make_request(url, headers=None, proxies=None, max_retries=3, backoff_factor=
     while retries < max_retries:
         try:
             logging.info(f"Attempting request to {url} (Attempt {retries + 1}/{max_retries})")
-            response = requests.get(url, headers=headers, proxies=proxies, timeout=10)
+            response = requests.get(url, headers=headers, proxies=proxies, timeout=10, stream=stream)
             response.raise_for_status()
             logging.info(f"Request successful for {url}")
             return response
@@ -128,7 +129,7 @@ def run_puppeteer_script(url):
         result = subprocess.run(['node', 'search_puppeteer.js', url], capture_output=True, text=True)
         if result.returncode == 0:
             logging.info(f"Puppeteer script ran successfully for {url}")
-            return json.loads(result.stdout)
+            return orjson.loads(result.stdout)
         else:
             logging.error(f"Puppeteer script failed for {url} with error: {result.stderr}")
             return None